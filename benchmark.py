@@ -0,0 +1,435 @@
+#!/usr/bin/env python
+# File: benchmark.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Script to benchmark the data structures and frames of the updating plots """
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import pathlib
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from random import randint
+
+import numpy as np
+
+from funcstream import HarmonicStream
+from precision import DTYPES
+from streambuffer import SlidingSeries
+
+ROOT = pathlib.Path(__file__).resolve().parent
+SIZES = (1_000, 100_000, 1_000_000)
+FRAME_SIZES = (1_000, 100_000)
+
+
+def scroll_np_append(xval, yval, step):
+    """The per-tick update of pyqtplot12 before SlidingSeries."""
+    window = [xval, yval]
+
+    def run(ticks):
+        xval, yval = window
+        for _ in range(ticks):
+            xval = xval[1:]
+            xval = np.append(xval, xval[-1] + step)
+            yval = yval[1:]
+            yval = np.append(yval, np.sin(xval[-1]))
+        window[:] = xval, yval
+        return xval, yval
+
+    return run
+
+
+def scroll_sliding_series(xval, yval, step):
+    """The per-tick update of pyqtplot12 with SlidingSeries."""
+    xser, yser = SlidingSeries(len(xval)), SlidingSeries(len(yval))
+    xser.extend(xval)
+    yser.extend(yval)
+
+    def run(ticks):
+        for _ in range(ticks):
+            xser.append(xser.last() + step)
+            yser.append(np.sin(xser.last()))
+        return xser.view(), yser.view()
+
+    return run
+
+
+def regenerate_linspace(xval, yval, step):
+    """The per-tick update of pyqtplot13 before HarmonicStream."""
+    size = len(xval)
+    window = [xval, yval]
+
+    def run(ticks):
+        xval, yval = window
+        for _ in range(ticks):
+            xval = np.linspace(xval[1], xval[-1] + step, size)
+            yval = np.sin(xval)
+        window[:] = xval, yval
+        return xval, yval
+
+    return run
+
+
+def regenerate_harmonic_stream(xval, yval, step):
+    """The per-tick update of pyqtplot13 with HarmonicStream."""
+    xser, yser = SlidingSeries(len(xval)), SlidingSeries(len(yval))
+    xser.extend(xval)
+    yser.extend(yval)
+    wave = HarmonicStream(xval[-1], step)
+
+    def run(ticks):
+        for _ in range(ticks):
+            xnew, ynew = wave.take_sin(1)
+            xser.extend(xnew)
+            yser.extend(ynew)
+        return xser.view(), yser.view()
+
+    return run
+
+
+def bench_compare(old, new, sizes=SIZES, ticks=1000):
+    """Time two per-tick updates and print their cost in microseconds.
+
+    Each update is a function building the window of a given size and
+    returning the tick loop, only the tick loop is timed."""
+    print(f"{'samples':>10} {old.__name__:>28} {new.__name__:>28} {'speedup':>8}")
+    for size in sizes:
+        xval, step = np.linspace(-2 * np.pi, 2 * np.pi, size, retstep=True)
+        yval = np.sin(xval)
+
+        # both updates must produce the same window
+        xref, yref = old(xval, yval, step)(10)
+        xnew, ynew = new(xval, yval, step)(10)
+        assert np.allclose(xref, xnew) and np.allclose(yref, ynew)
+
+        times = []
+        for func in (old, new):
+            best = float("inf")
+            for _ in range(3):
+                run = func(xval, yval, step)  # the window is built untimed
+                start = time.perf_counter()
+                run(ticks)
+                best = min(best, time.perf_counter() - start)
+            times.append(best)
+        print(
+            f"{size:>10} {1e6 * times[0] / ticks:>26.2f}us "
+            f"{1e6 * times[1] / ticks:>26.2f}us {times[0] / times[1]:>7.1f}x"
+        )
+
+
+def build_scroll(module, size):
+    """Window of pyqtplot11 scrolling size random integers."""
+    from datasource import SyntheticSource
+
+    xval = list(range(size))
+    return module.MainWindow(xval, [randint(0, 100) for _ in xval], SyntheticSource())
+
+
+def build_sine(module, size):
+    """Window of pyqtplot12/13 scrolling size samples of sin(x)."""
+    xval, step = np.linspace(-2 * np.pi, 2 * np.pi, size, retstep=True)
+    return module.MainWindow(xval, np.sin(xval), step)
+
+
+def build_reveal(module, size, ticks):
+    """Window of pyqtplot14 revealing the last ticks of size samples."""
+    xval = np.linspace(-2 * np.pi, 2 * np.pi, size)
+    window = module.MainWindow(xval, np.sin(xval))
+    window.nval = max(size - ticks, 0)
+    return window
+
+
+def build_reveal_pair(module, size, ticks):
+    """Window of pyqtplot15/17 revealing the last ticks of size samples."""
+    xval = np.linspace(-2 * np.pi, 2 * np.pi, size)
+    window = module.MainWindow(xval, np.sin(xval), np.cos(xval))
+    window.nval = max(size - ticks, 0)
+    return window
+
+
+def build_lorenz(module, size, ticks):
+    """Window of pyqtplot18 revealing the last ticks of size integrated points."""
+    from lorenz import LorenzStream
+
+    window = module.MainWindow(LorenzStream(np.ones(3), size, 0.01))
+    window.n = max(size - ticks, 0)
+    window.stream.view(window.n)
+    return window
+
+
+WINDOWS = {
+    "pyqtplot11": lambda module, size, ticks: build_scroll(module, size),
+    "pyqtplot12": lambda module, size, ticks: build_sine(module, size),
+    "pyqtplot13": lambda module, size, ticks: build_sine(module, size),
+    "pyqtplot14": build_reveal,
+    "pyqtplot15": build_reveal_pair,
+    "pyqtplot17": build_reveal_pair,
+    "pyqtplot18": build_lorenz,
+}
+
+
+def percentiles(samples):
+    """Return the p50 and p99 of the samples in milliseconds."""
+    p50, p99 = np.percentile(np.asarray(samples) * 1e3, [50, 99])
+    return {"p50": round(float(p50), 4), "p99": round(float(p99), 4)}
+
+
+def timed_setdata(window, setdata):
+    """Wrap the setData of every data_line of the window to time it."""
+    for name, curve in vars(window).items():
+        if not name.startswith("data_line"):
+            continue
+
+        def wrapper(*args, _setdata=curve.setData, **kwargs):
+            start = time.perf_counter()
+            _setdata(*args, **kwargs)
+            setdata[-1] += time.perf_counter() - start
+
+        curve.setData = wrapper
+
+
+def run_frames(name, size, ticks, chrome=True, dtype="float64"):
+    """Drive update_data_line of one window for ticks frames and measure them.
+
+    Runs in a fresh process, so peak RSS belongs to this window alone. With
+    chrome=False the title, axes, grid and legend are painted every frame
+    instead of being drawn from their cached pixmaps. The data of the window
+    is stored as dtype, the memory its construction allocated is traced."""
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    sys.path.insert(0, str(ROOT))
+    from PyQt6 import QtWidgets
+
+    from chrome import cache_chrome
+    from precision import set_float_dtype
+
+    set_float_dtype(dtype)
+    app = QtWidgets.QApplication([])
+    module = importlib.import_module(name)
+    tracemalloc.start()
+    window = WINDOWS[name](module, size, ticks)
+    built, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    window.timer.stop()
+    if not chrome:
+        cache_chrome(window.graphWidget, enabled=False)
+    window.show()
+    app.processEvents()
+
+    update, setdata, paint = [], [], []
+    timed_setdata(window, setdata)
+    for _ in range(ticks):
+        setdata.append(0.0)
+        start = time.perf_counter()
+        window.update_data_line()
+        update.append(time.perf_counter() - start - setdata[-1])
+
+        start = time.perf_counter()
+        app.processEvents()
+        window.repaint()
+        paint.append(time.perf_counter() - start)
+
+    # allocations are traced on a separate run, tracing slows the frames down
+    count = min(ticks, 100)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(count):
+        window.update_data_line()
+        app.processEvents()
+        window.repaint()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    window.close()
+
+    return {
+        "script": name,
+        "size": size,
+        "ticks": ticks,
+        "chrome_cache": chrome,
+        "dtype": dtype,
+        "update_ms": percentiles(update),
+        "setdata_ms": percentiles(setdata),
+        "paint_ms": percentiles(paint),
+        "frame_ms": percentiles(np.add(np.add(update, setdata), paint)),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "build_kb": round(built / 1024, 1),
+        "traced_peak_kb": round(peak / 1024, 1),
+        "blocks_per_tick": round(blocks / count, 1),
+    }
+
+
+def run_series(count, points, merged, ticks):
+    """Plot count series in the pyqtplot10 window and measure its repaint.
+
+    The series are one item each, or merged into one item with merged."""
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    sys.path.insert(0, str(ROOT))
+    from PyQt6 import QtWidgets
+
+    import pyqtplot10
+
+    app = QtWidgets.QApplication([])
+    rng = np.random.default_rng(0)
+    hour = np.arange(1, points + 1)
+    temperature = 36 + np.cumsum(rng.standard_normal((count, points)), axis=1)
+    legends = [f"Sensor {index + 1}" for index in range(count)]
+
+    start = time.perf_counter()
+    window = pyqtplot10.MainWindow()
+    if merged:
+        window.graphSeries(hour, temperature, legends, "#d81b60", "#004d40")
+    else:
+        for ordinate, legend in zip(temperature, legends):
+            window.graphPlot(hour, ordinate, legend, "#d81b60", "#004d40")
+    window.show()
+    app.processEvents()
+    build = time.perf_counter() - start
+
+    # nothing changes between the frames, the viewport is redrawn by hand
+    paint = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        window.graphWidget.viewport().repaint()
+        paint.append(time.perf_counter() - start)
+    window.close()
+
+    return {
+        "series": count,
+        "merged": merged,
+        "build_s": round(build, 3),
+        "paint_ms": percentiles(paint),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def bench_series(counts, points, ticks):
+    """Compare one item per series with one merged item, in fresh processes."""
+    context = multiprocessing.get_context("spawn")
+    print(
+        f"{'series':>7} {'mode':<8} {'build':>8} {'paint':>9} {'p99':>9} {'rss MB':>7}"
+    )
+    for count in counts:
+        for merged in (False, True):
+            with ProcessPoolExecutor(1, mp_context=context) as pool:
+                result = pool.submit(run_series, count, points, merged, ticks).result()
+            print(
+                f"{count:>7} {'merged' if merged else 'items':<8} "
+                f"{result['build_s']:>7.3f}s {result['paint_ms']['p50']:>7.3f}ms "
+                f"{result['paint_ms']['p99']:>7.3f}ms {result['peak_rss_kb'] / 1024:>7.1f}"
+            )
+
+
+def bench_frames(scripts, sizes, ticks, output=None, chrome=True, dtype="float64"):
+    """Benchmark every script at every size, each case in a fresh process."""
+    results = []
+    context = multiprocessing.get_context("spawn")
+    print(
+        f"{'script':<11} {'size':>8} {'update':>8} {'setData':>8} {'paint':>8} "
+        f"{'p99':>8} {'rss MB':>7} {'data kB':>9}"
+    )
+    for name in scripts:
+        for size in sizes:
+            with ProcessPoolExecutor(1, mp_context=context) as pool:
+                result = pool.submit(
+                    run_frames, name, size, ticks, chrome, dtype
+                ).result()
+            results.append(result)
+            print(
+                f"{name:<11} {size:>8} {result['update_ms']['p50']:>6.3f}ms "
+                f"{result['setdata_ms']['p50']:>6.3f}ms {result['paint_ms']['p50']:>6.3f}ms "
+                f"{result['frame_ms']['p99']:>6.3f}ms {result['peak_rss_kb'] / 1024:>7.1f} "
+                f"{result['build_kb']:>9.1f}"
+            )
+
+    report = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if output:
+        pathlib.Path(output).write_text(json.dumps(report, indent=2))
+    return report
+
+
+def compare_frames(old, new):
+    """Print the p50 frame time and data memory of two result files."""
+    old = json.loads(pathlib.Path(old).read_text())["results"]
+    new = json.loads(pathlib.Path(new).read_text())["results"]
+    base = {(result["script"], result["size"]): result for result in old}
+    print(
+        f"{'script':<11} {'size':>8} {'old':>10} {'new':>10} {'ratio':>7} "
+        f"{'old kB':>9} {'new kB':>9}"
+    )
+    for result in new:
+        key = (result["script"], result["size"])
+        if key not in base:
+            continue
+        before, after = base[key]["frame_ms"]["p50"], result["frame_ms"]["p50"]
+        print(
+            f"{key[0]:<11} {key[1]:>8} {before:>8.3f}ms {after:>8.3f}ms "
+            f"{before / after if after else float('inf'):>6.2f}x "
+            f"{base[key].get('build_kb', float('nan')):>9.1f} "
+            f"{result.get('build_kb', float('nan')):>9.1f}"
+        )
+
+
+def main():
+    """Run the benchmark selected on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    buffers = commands.add_parser("buffers", help="per-tick data structure updates")
+    buffers.add_argument("--ticks", type=int, default=1000)
+
+    frames = commands.add_parser("frames", help="frame times of the animated scripts")
+    frames.add_argument("scripts", nargs="*", default=list(WINDOWS))
+    frames.add_argument("--sizes", type=int, nargs="+", default=FRAME_SIZES)
+    frames.add_argument("--ticks", type=int, default=200)
+    frames.add_argument("--output", help="JSON file to write the results to")
+    frames.add_argument(
+        "--no-chrome-cache",
+        dest="chrome",
+        action="store_false",
+        help="paint the title, axes, grid and legend every frame",
+    )
+    frames.add_argument(
+        "--dtype", choices=DTYPES, default="float64", help="storage of the data"
+    )
+
+    compare = commands.add_parser("compare", help="compare two frames result files")
+    compare.add_argument("old")
+    compare.add_argument("new")
+
+    series = commands.add_parser("series", help="many series, items or merged")
+    series.add_argument("--counts", type=int, nargs="+", default=(20, 200, 2000))
+    series.add_argument("--points", type=int, default=10)
+    series.add_argument("--ticks", type=int, default=50)
+
+    args = parser.parse_args()
+    if args.command == "buffers":
+        bench_compare(scroll_np_append, scroll_sliding_series, ticks=args.ticks)
+        bench_compare(regenerate_linspace, regenerate_harmonic_stream, ticks=args.ticks)
+    elif args.command == "frames":
+        scripts = [pathlib.Path(script).stem for script in args.scripts]
+        bench_frames(
+            scripts, args.sizes, args.ticks, args.output, args.chrome, args.dtype
+        )
+    elif args.command == "series":
+        bench_series(args.counts, args.points, args.ticks)
+    else:
+        compare_frames(args.old, args.new)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# File: channels.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module with a multi-channel frame owning the data of curves sharing x """
+
+import numpy as np
+
+from precision import float_dtype
+
+
+class ChannelFrame:
+    """Columnar frame of one x buffer and a 2D array of channels.
+
+    The channels are the rows of one (channels, samples) array, so each of
+    them is contiguous and a channel view is a slice of one row. Curves are
+    bound to a channel and the frame hands them the same x view and their
+    row on every reveal or append, x is never duplicated per curve.
+
+    The first `count` samples are shown. reveal() moves the count over
+    data already in the frame, for the progressive plots, and append()
+    adds samples, the storage grows by doubling so appending is amortized
+    O(channels) per sample. Curves with a grow method (DecimatedCurve) get
+    the new samples with grow instead of setData. With a BatchUpdate the
+    curves are set through it, so many channels cost one repaint. The
+    samples are stored as dtype, that of the precision policy by default."""
+
+    def __init__(self, xval, channels, names=None, count=None, batch=None, dtype=None):
+        dtype = float_dtype(dtype)
+        xval = np.asarray(xval, dtype=dtype)
+        channels = np.atleast_2d(np.asarray(channels, dtype=dtype))
+        if channels.shape[1] != len(xval):
+            raise ValueError("channels must have one sample per x value")
+        self._xval = xval.copy()
+        self._data = channels.copy()
+        self._size = len(xval)
+        self.count = self._size if count is None else min(count, self._size)
+        self.names = list(names) if names is not None else []
+        self.batch = batch
+        self.bound = []  # (curve, channel) pairs
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def channels(self):
+        """Number of channels."""
+        return len(self._data)
+
+    @property
+    def xval(self):
+        """View of the shown x values."""
+        return self._xval[: self.count]
+
+    def channel(self, key):
+        """View of the shown samples of a channel, by index or name."""
+        index = self.names.index(key) if isinstance(key, str) else key
+        return self._data[index, : self.count]
+
+    def view(self):
+        """View of the shown samples of every channel, one per row."""
+        return self._data[:, : self.count]
+
+    def bind(self, curve, key):
+        """Draw a channel, by index or name, with the curve from now on."""
+        index = self.names.index(key) if isinstance(key, str) else key
+        self.bound.append((curve, index))
+        self._draw([(curve, index)], grown=False)
+
+    def reveal(self, count):
+        """Show the first count samples on every bound curve."""
+        count = min(max(count, 0), self._size)
+        grown = count >= self.count
+        self.count = count
+        self._draw(self.bound, grown)
+
+    def append(self, xval, values):
+        """Append samples, values has one row per channel, and show them."""
+        xval = np.atleast_1d(np.asarray(xval, dtype=self._data.dtype))
+        values = np.asarray(values, dtype=self._data.dtype)
+        values = values.reshape(self.channels, -1)
+        size = self._size + len(xval)
+        if size > len(self._xval):
+            capacity = max(size, 2 * len(self._xval), 16)
+            self._xval = np.resize(self._xval, capacity)
+            data = np.empty((self.channels, capacity), dtype=self._data.dtype)
+            data[:, : self._size] = self._data[:, : self._size]
+            self._data = data
+        self._xval[self._size : size] = xval
+        self._data[:, self._size : size] = values
+        self._size = size
+        self.reveal(size)
+
+    def _draw(self, bound, grown):
+        """Hand the shown x and channel views to the curves."""
+        xval = self.xval  # one x view shared by every curve
+        for curve, index in bound:
+            yval = self._data[index, : self.count]
+            if grown and hasattr(curve, "grow"):
+                curve.grow(xval, yval)
+            elif self.batch is not None:
+                self.batch.setData(curve, xval, yval)
+            else:
+                curve.setData(xval, yval)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# File: chrome.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module to draw the static chrome of the plots from cached pixmaps """
+
+import pyqtgraph as pg
+from PyQt6 import QtWidgets
+
+CACHED = QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache
+UNCACHED = QtWidgets.QGraphicsItem.CacheMode.NoCache
+
+
+def plot_items(view):
+    """Return the PlotItems of a PlotWidget or a GraphicsLayoutWidget."""
+    if hasattr(view, "getPlotItem"):
+        return [view.getPlotItem()]
+    return [item for item in view.ci.items if isinstance(item, pg.PlotItem)]
+
+
+def cache_chrome(view, moving=(), enabled=True):
+    """Draw the title, axes, grid and legend of every plot from pixmaps.
+
+    Each item is rasterised once into a pixmap of its own, which Qt redraws
+    only when the item changes (a new style, range or legend entry) or is
+    resized, so a tick that only sets curve data blits the pixmaps instead
+    of painting text, ticks and grid lines again. The background is already
+    cached by the GraphicsView. Axes named in `moving` (e.g. "bottom" for a
+    scrolling x range) change every tick and are left uncached, rasterising
+    them again would cost more than painting them."""
+    for plot in plot_items(view):
+        items = [plot.titleLabel]
+        if plot.legend is not None:
+            items.append(plot.legend)
+        for name, axis in plot.axes.items():
+            if name not in moving:
+                items.append(axis["item"])
+        for item in items:
+            item.setCacheMode(CACHED if enabled else UNCACHED)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python
+# File: datasource.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module with data sources feeding the updating plots, live or from files """
+
+import argparse
+import os
+import threading
+import time
+
+import numpy as np
+
+from precision import float_dtype
+
+
+class SPSCBuffer:
+    """Bounded single-producer/single-consumer queue of samples.
+
+    The producer only moves the tail counter and the consumer only moves
+    the head counter, each after its copy is complete, so neither side
+    takes a lock. The counters grow without bound and are reduced modulo
+    the capacity to index the storage. Samples that do not fit are dropped
+    and counted in `overruns` rather than blocking the producer."""
+
+    def __init__(self, capacity, dtype=None):
+        self.capacity = int(capacity)
+        self._data = np.empty(self.capacity, dtype=float_dtype(dtype))
+        self._head = 0  # samples read, written by the consumer only
+        self._tail = 0  # samples written, written by the producer only
+        self.overruns = 0
+
+    def __len__(self):
+        return self._tail - self._head
+
+    def write(self, values):
+        """Copy as many samples as fit in, return how many were written."""
+        values = np.asarray(values, dtype=self._data.dtype).ravel()
+        tail = self._tail
+        count = min(values.size, self.capacity - (tail - self._head))
+        self.overruns += values.size - count
+        start = tail % self.capacity
+        first = min(count, self.capacity - start)
+        self._data[start : start + first] = values[:first]
+        self._data[: count - first] = values[first:count]
+        self._tail = tail + count  # publish after the copy
+        return count
+
+    def read(self):
+        """Return every available sample as a new array, oldest first."""
+        head, tail = self._head, self._tail
+        count = tail - head
+        start = head % self.capacity
+        first = min(count, self.capacity - start)
+        values = np.concatenate(
+            (self._data[start : start + first], self._data[: count - first])
+        )
+        self._head = head + count  # release after the copy
+        return values
+
+
+class DataSource:
+    """Interface of the sources of live samples.
+
+    read() is called from the GUI thread on every frame and returns the
+    samples that arrived since the previous call, possibly none."""
+
+    def start(self):
+        """Start acquiring samples."""
+
+    def stop(self):
+        """Stop acquiring samples."""
+
+    def read(self):
+        """Return the new samples as a 1D array."""
+        raise NotImplementedError
+
+
+class ThreadedSource(DataSource):
+    """Source whose produce() runs in a worker thread.
+
+    produce() returns a batch of samples per call, it is called in a loop
+    until stop() and the batches are handed to the GUI thread through an
+    SPSCBuffer, so a slow read never stalls the frames."""
+
+    def __init__(self, capacity=1 << 20, dtype=None):
+        self.buffer = SPSCBuffer(capacity, dtype)
+        self._running = threading.Event()
+        self._thread = None
+
+    def produce(self):
+        """Return the next batch of samples, blocking as long as needed."""
+        raise NotImplementedError
+
+    def _run(self):
+        while self._running.is_set():
+            self.buffer.write(self.produce())
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._running.clear()
+        self._thread.join()
+        self._thread = None
+
+    def read(self):
+        return self.buffer.read()
+
+
+class RandomSource(ThreadedSource):
+    """Source of random integers in [low, high] at a fixed rate per second.
+
+    Samples are generated in batches paced against the clock, the thread
+    sleeps at least `period` seconds between batches, so high rates cost a
+    few vectorised calls per frame instead of one call per sample."""
+
+    def __init__(self, rate=20, low=0, high=100, period=0.005, **kwargs):
+        super().__init__(**kwargs)
+        self.rate = rate
+        self.low = low
+        self.high = high
+        self.period = period
+        self._rng = np.random.default_rng()
+        self._origin = None
+        self._produced = 0
+
+    def produce(self):
+        if self._origin is None:
+            self._origin = time.perf_counter()
+        elapsed = time.perf_counter() - self._origin
+        count = int(elapsed * self.rate) - self._produced
+        if count <= 0:
+            # sleep until the next sample is due, but at least one period
+            time.sleep(max(self.period, (self._produced + 1) / self.rate - elapsed))
+            return np.empty(0)
+        self._produced += count
+        return self._rng.integers(self.low, self.high, count, endpoint=True)
+
+
+class SyntheticSource(DataSource):
+    """Source returning `count` random integers in [low, high] on every read.
+
+    It runs in the calling thread, which makes frame benchmarks
+    deterministic in the amount of data per frame."""
+
+    def __init__(self, count=1, low=0, high=100):
+        self.count = count
+        self.low = low
+        self.high = high
+        self._rng = np.random.default_rng()
+
+    def read(self):
+        return self._rng.integers(self.low, self.high, self.count, endpoint=True)
+
+
+class MemmapSource(DataSource):
+    """Source of the rows of a binary file of float32 or float64 columns.
+
+    The file holds rows of `columns` values of `dtype` after `offset`
+    header bytes. It is mapped with np.memmap, so opening it is instant and
+    the pages are only read when a view touches them, and the memory used
+    does not grow with the file. column() returns zero-copy views to hand
+    to plot/setData. read() follows the tail of the file: when the file
+    grew it is mapped anew and only the rows appended since the previous
+    read are returned, a row still being written is left for later."""
+
+    def __init__(self, path, columns=2, dtype=np.float32, offset=0):
+        self.path = os.fspath(path)
+        self.columns = columns
+        self.dtype = np.dtype(dtype)
+        self.offset = offset
+        self.data = np.empty((0, columns), dtype=self.dtype)
+        self.remap()
+        self._read = len(self)  # rows returned by read, from the tail on
+
+    def __len__(self):
+        return len(self.data)
+
+    def remap(self):
+        """Map the complete rows of the file, return the number of new rows."""
+        size = os.path.getsize(self.path) - self.offset
+        rows = max(size, 0) // (self.columns * self.dtype.itemsize)
+        grown = rows - len(self)
+        if grown:
+            # a new mapping of the whole file, no data is read here
+            self.data = np.memmap(
+                self.path,
+                dtype=self.dtype,
+                mode="r",
+                offset=self.offset,
+                shape=(rows, self.columns),
+            )
+        return max(grown, 0)
+
+    def column(self, index):
+        """Return a zero-copy view of one column of the mapped rows."""
+        return self.data[:, index]
+
+    def read(self):
+        """Return the rows appended since the previous read as a 2D view."""
+        self.remap()
+        rows = self.data[self._read :]
+        self._read = len(self)
+        return rows
+
+
+def record(args):
+    """Append rows of time and noisy sines to a file, like an acquisition."""
+    rng = np.random.default_rng()
+    dtype = np.dtype(args.dtype)
+    origin = time.perf_counter()
+    written = 0
+    with open(args.file, "ab") as file:
+        while (elapsed := time.perf_counter() - origin) < args.duration:
+            count = int(elapsed * args.rate) - written
+            if count > 0:
+                rows = np.empty((count, args.columns), dtype=dtype)
+                rows[:, 0] = (written + np.arange(count)) / args.rate
+                phase = rows[:, :1] * np.arange(1, args.columns)
+                rows[:, 1:] = np.sin(phase) + 0.1 * rng.standard_normal(phase.shape)
+                file.write(rows.tobytes())
+                file.flush()
+                written += count
+            time.sleep(0.01)
+    print(f"appended {written} rows to {args.file}")
+
+
+def create_window(args):
+    """Create the pyqtplot10 window plotting the columns of a file against
+    its first column, following its tail, hidden by default."""
+    import pyqtplot10
+    from decimate import DecimatedCurve
+    from scheduler import shared_scheduler
+
+    window = pyqtplot10.MainWindow()
+    # the y range of the window is fixed for its sensor readings
+    window.graphWidget.enableAutoRange(axis="y")
+    source = MemmapSource(args.file, args.columns, args.dtype)
+    colors = ["#d81b60", "#1e88e5", "#43a047", "#fdd835", "#8e24aa", "#00acc1"]
+    curves = [
+        DecimatedCurve(
+            window.graphWidget,
+            source.column(0),
+            source.column(index),
+            extrema=False,
+            name=f"Column {index}",
+            pen=colors[(index - 1) % 6],
+        )
+        for index in range(1, args.columns)
+    ]
+
+    def show_tail():
+        """Show the last rows only, so no more of the file is read."""
+        xval = source.column(0)
+        if len(xval):
+            # float32 scalars overflow in the range arithmetic of pyqtgraph
+            xmin = float(xval[max(len(xval) - args.window, 0)])
+            window.graphWidget.setXRange(xmin, float(xval[-1]), padding=0)
+
+    def update_data_line(frames=1):
+        if len(source.read()):
+            for index, curve in enumerate(curves, 1):
+                curve.grow(source.column(0), source.column(index))
+            show_tail()
+
+    show_tail()
+    window.timer = shared_scheduler().add(update_data_line)
+    return window
+
+
+def plot(args):
+    """Plot the columns of a file against its first column, following its tail."""
+    import sys
+
+    from PyQt6 import QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv)
+    window = create_window(args)
+    window.show()
+    sys.exit(app.exec())
+
+
+def main():
+    """Record a growing file or plot one, following its tail."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=("record", "plot"))
+    parser.add_argument("file", help="binary file of rows of columns")
+    parser.add_argument("--columns", type=int, default=2, help="values per row")
+    parser.add_argument("--dtype", choices=("float32", "float64"), default="float32")
+    parser.add_argument("--rate", type=float, default=1000, help="rows/s to record")
+    parser.add_argument("--duration", type=float, default=10, help="seconds to record")
+    parser.add_argument("--window", type=int, default=10_000, help="rows in view")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args)
+    else:
+        plot(args)
+
+
+if __name__ == "__main__":
+    main()
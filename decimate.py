@@ -0,0 +1,320 @@
+#!/usr/bin/env python
+# File: decimate.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module to decimate series far larger than the plot window for display """
+
+import numpy as np
+import pyqtgraph as pg
+
+from precision import float_dtype
+from streambuffer import SlidingSeries
+
+
+def m4_indices(xval, yval, xmin, xmax, width):
+    """Return the indices of the points that draw (xval, yval) at width pixels.
+
+    xval must be sorted ascending. The visible range [xmin, xmax] is split
+    into one bucket per pixel column and the first, minimum, maximum and
+    last point of every bucket are kept in index order (M4 aggregation), so
+    a line through them rasterises to the same pixels as the full series.
+    One point on each side of the range is kept to draw the edge segments."""
+    size = len(xval)
+    lo = max(int(np.searchsorted(xval, xmin, side="left")) - 1, 0)
+    hi = min(int(np.searchsorted(xval, xmax, side="right")) + 1, size)
+    if hi - lo <= 4 * width or xmax <= xmin:
+        return np.arange(lo, hi)
+
+    # pixel column of every point, the edge points fall in the end columns
+    xvis, yvis = xval[lo:hi], yval[lo:hi]
+    col = ((xvis - xmin) * (width / (xmax - xmin))).astype(np.intp)
+    np.clip(col, 0, width - 1, out=col)
+    starts = np.flatnonzero(np.diff(col)) + 1
+    starts = np.concatenate(([0], starts))
+    ends = np.concatenate((starts[1:], [len(col)]))
+
+    # position of the first minimum and maximum in every bucket
+    bucket = np.repeat(np.arange(len(starts)), ends - starts)
+    extrema = []
+    for reduce in (np.minimum, np.maximum):
+        value = reduce.reduceat(yvis, starts)
+        hit = np.flatnonzero(yvis == value[bucket])
+        _, first = np.unique(bucket[hit], return_index=True)
+        index = starts.copy()  # buckets of NaN keep their first point
+        index[bucket[hit[first]]] = hit[first]
+        extrema.append(index)
+
+    index = np.stack((starts, extrema[0], extrema[1], ends - 1), axis=1)
+    index.sort(axis=1)
+    return np.unique(index.ravel()) + lo
+
+
+def m4(xval, yval, xmin, xmax, width):
+    """Return the M4 decimated (x, y) arrays of the visible range."""
+    index = m4_indices(xval, yval, xmin, xmax, width)
+    return xval[index], yval[index]
+
+
+class MinMaxPyramid:
+    """Multi-resolution min/max index of a series sorted by x.
+
+    Level k holds, for every bucket of 2**k consecutive points, the index
+    of its minimum and of its maximum. The pyramid is built once in O(N).
+    A view is then answered without touching the visible points: the index
+    range of every pixel column is found by binary search on x and split
+    into at most two buckets per level, so the exact M4 points of all the
+    columns cost O(pixels * log N) vectorised work whatever the zoom.
+
+    A growing series is indexed by grow(): only the last bucket of every
+    level and the buckets of the new points are computed again, and every
+    level is kept in storage that doubles when full, so appending n points
+    costs O(n + log N) instead of a rebuild."""
+
+    def __init__(self, xval, yval, base=2):
+        self.xval = self.yval = np.empty(0)
+        self.base = base  # level of the finest bucket, 2**base points
+        self.mins = []  # views of the filled part of every level
+        self.maxs = []
+        self._storage = ([], [])  # growing arrays of the min and max levels
+        self.grow(xval, yval)
+
+    def grow(self, xval, yval):
+        """Index the series after points were appended to it.
+
+        The points already indexed must be unchanged, only the buckets
+        from the last one of the previous series on are computed again."""
+        indexed = len(self.yval) if self.mins else 0
+        self.xval = np.asarray(xval)
+        self.yval = np.asarray(yval)
+
+        size = len(self.yval)
+        bucket = 1 << self.base
+        if size < 2 * bucket:
+            self.mins, self.maxs = [], []
+            return
+
+        # finest level straight from the samples, the remainder is a short bucket
+        first = indexed // bucket  # first bucket to compute again
+        start = first * bucket
+        full = start + (size - start) // bucket * bucket
+        block = self.yval[start:full].reshape(-1, bucket)
+        offset = np.arange(start, full, bucket)
+        mins = offset + block.argmin(axis=1)
+        maxs = offset + block.argmax(axis=1)
+        if full < size:
+            rest = self.yval[full:]
+            mins = np.append(mins, full + rest.argmin())
+            maxs = np.append(maxs, full + rest.argmax())
+        levels = [
+            [self._store(storage, 0, first, values)]
+            for storage, values in zip(self._storage, (mins, maxs))
+        ]
+
+        # every coarser level merges pairs of buckets of the level below
+        while len(levels[0][-1]) > 1:
+            level, first = len(levels[0]), first // 2
+            for arrays, storage, better in zip(
+                levels, self._storage, (np.less_equal, np.greater_equal)
+            ):
+                merged = self._merge(arrays[-1][2 * first :], better)
+                arrays.append(self._store(storage, level, first, merged))
+        self.mins, self.maxs = levels
+
+    @staticmethod
+    def _store(storage, level, first, values):
+        """Write values into a level from bucket first on, return its view."""
+        size = first + len(values)
+        if level == len(storage):
+            storage.append(np.empty(max(size, 16), dtype=np.intp))
+        elif size > len(storage[level]):
+            grown = np.empty(max(size, 2 * len(storage[level])), dtype=np.intp)
+            grown[:first] = storage[level][:first]
+            storage[level] = grown
+        storage[level][first:size] = values
+        return storage[level][:size]
+
+    def _merge(self, index, better):
+        """Return the winner of every pair of buckets of the index array."""
+        pairs = len(index) // 2
+        left, right = index[0 : 2 * pairs : 2], index[1 : 2 * pairs : 2]
+        merged = np.where(better(self.yval[left], self.yval[right]), left, right)
+        return np.append(merged, index[2 * pairs :])
+
+    def _bucket(self, level, start, arrays, reduce):
+        """Return the extremum index of the buckets of level starting at start."""
+        if level >= self.base:
+            return arrays[level - self.base][start >> level]
+        # levels finer than the base are read from the samples themselves
+        index = start[:, np.newaxis] + np.arange(1 << level)
+        return index[np.arange(len(start)), reduce(self.yval[index], axis=1)]
+
+    def _extremum(self, starts, ends, arrays, reduce, better):
+        """Return the extremum index of every range [starts, ends) of points."""
+        left, right = starts.copy(), ends.copy()
+        best = starts.copy()
+        for level in range(self.base + len(arrays)):
+            size = 1 << level
+            # consume the unaligned bucket at the left and at the right end
+            for side, start in ((left, left), (right, right - size)):
+                mask = (side & size).astype(bool) & (right - left >= size)
+                if not mask.any():
+                    continue
+                cand = self._bucket(level, start[mask], arrays, reduce)
+                keep = best[mask]
+                best[mask] = np.where(
+                    better(self.yval[cand], self.yval[keep]), cand, keep
+                )
+                if side is left:
+                    left[mask] += size
+                else:
+                    right[mask] -= size
+        return best
+
+    def query(self, xmin, xmax, width):
+        """Return the indices of the points that draw [xmin, xmax] at width pixels."""
+        size = len(self.xval)
+        lo = max(int(np.searchsorted(self.xval, xmin, side="left")) - 1, 0)
+        hi = min(int(np.searchsorted(self.xval, xmax, side="right")) + 1, size)
+        if hi - lo <= 4 * width or xmax <= xmin or not self.mins:
+            return m4_indices(self.xval, self.yval, xmin, xmax, width)
+
+        # index range of every non-empty pixel column, as in m4_indices
+        edges = xmin + (xmax - xmin) * np.arange(1, width) / width
+        bounds = np.searchsorted(self.xval[lo:hi], edges, side="left") + lo
+        starts = np.concatenate(([lo], bounds))
+        ends = np.concatenate((bounds, [hi]))
+        starts, ends = starts[ends > starts], ends[ends > starts]
+
+        mins = self._extremum(starts, ends, self.mins, np.argmin, np.less)
+        maxs = self._extremum(starts, ends, self.maxs, np.argmax, np.greater)
+        index = np.stack((starts, mins, maxs, ends - 1), axis=1)
+        index.sort(axis=1)
+        return np.unique(index.ravel())
+
+
+class DecimatedCurve:
+    """Curve that hands only the M4 decimation of its data to setData.
+
+    The full series is kept here and re-decimated to the pixel width of the
+    view whenever the x range or the size of the view changes. The first,
+    last, lowest and highest points of the whole series are always drawn,
+    they lie outside a zoomed view but keep the item bounds (and autorange)
+    those of the full data.
+
+    With pyramid=True a MinMaxPyramid is built once per series, so zoom and
+    pan over a large static series do not rescan the full arrays. With
+    extrema=False the lowest and highest points are not searched for, so
+    setting a memory-mapped series only reads the points in view."""
+
+    def __init__(
+        self, plot, xval=None, yval=None, pyramid=False, extrema=True, **kwargs
+    ):
+        self.item = plot.plot(**kwargs)
+        self.viewbox = plot.getViewBox()
+        self.pyramid = pyramid
+        self.extrema = extrema
+        self.index = None
+        self.xval = np.empty(0)
+        self.yval = np.empty(0)
+        self._xs = self._ys = None  # growing buffers once extend is called
+        self._extrema = ()
+        self._anchors = np.empty(0, dtype=np.intp)
+
+        self.viewbox.sigXRangeChanged.connect(self.update)
+        self.viewbox.sigResized.connect(self.update)
+
+        if xval is not None:
+            self.setData(xval, yval)
+
+    def setData(self, xval, yval):
+        """Set the full series, xval must be sorted ascending."""
+        self._xs = self._ys = None
+        self.xval = np.asarray(xval)
+        self.yval = np.asarray(yval)
+        self._extrema = ()
+        if self.extrema and len(self.yval):
+            self._extrema = (np.nanargmin(self.yval), np.nanargmax(self.yval))
+        self._refresh()
+
+    def extend(self, xval, yval):
+        """Append points to the series, xval must continue ascending.
+
+        The series is moved into growing buffers on the first call, later
+        calls cost amortized O(1) per point plus the decimation of the view.
+        The pyramid, if any, is extended over the new points only."""
+        yval = np.asarray(yval)
+        if not len(yval):
+            return
+        if self._xs is None:
+            # the points already indexed keep their values, and int series
+            # are promoted to a float dtype that holds the new points too
+            self._xs = SlidingSeries(
+                dtype=np.result_type(self.xval.dtype, float_dtype())
+            )
+            self._ys = SlidingSeries(
+                dtype=np.result_type(self.yval.dtype, float_dtype())
+            )
+            self._xs.extend(self.xval)
+            self._ys.extend(self.yval)
+        size = len(self._ys)
+        self._xs.extend(xval)
+        self._ys.extend(yval)
+        self._grown(self._xs.view(), self._ys.view(), size)
+
+    def grow(self, xval, yval):
+        """Set the series after it grew in place, e.g. a file mapped anew.
+
+        The first points are those of the current series, so unlike setData
+        only the new points are scanned and no copy of the series is made."""
+        self._xs = self._ys = None
+        self._grown(np.asarray(xval), np.asarray(yval), len(self.yval))
+
+    def _grown(self, xval, yval, size):
+        """Take the series whose points from index size on are new."""
+        self.xval, self.yval = xval, yval
+        if size == len(yval):
+            return
+
+        if self.extrema:
+            # only the appended points can displace the extrema of the series
+            new = yval[size:]
+            imin, imax = size + np.nanargmin(new), size + np.nanargmax(new)
+            if size:
+                imin = min(self._extrema[0], imin, key=lambda index: yval[index])
+                imax = max(self._extrema[1], imax, key=lambda index: yval[index])
+            self._extrema = (imin, imax)
+        self._refresh(grown=True)
+
+    def _refresh(self, grown=False):
+        """Recompute the anchor points and the pyramid, then redraw.
+
+        With grown the series only had points appended, so the pyramid is
+        extended over the new points instead of being built again."""
+        if len(self.xval):
+            self._anchors = np.unique([0, len(self.xval) - 1, *self._extrema])
+        else:
+            self._anchors = np.empty(0, dtype=np.intp)
+        if self.pyramid and grown and self.index is not None:
+            self.index.grow(self.xval, self.yval)
+        elif self.pyramid:
+            self.index = MinMaxPyramid(self.xval, self.yval)
+        self.update()
+
+    def pixelWidth(self):
+        """Return the width of the view in pixels, 640 before it is laid out."""
+        width = int(self.viewbox.width())
+        return width if width > 0 else 640
+
+    def update(self):
+        """Decimate the visible range of the series and draw it."""
+        if not len(self.xval):
+            self.item.setData([], [])
+            return
+        xmin, xmax = self.viewbox.viewRange()[0]
+        if self.index is not None:
+            index = self.index.query(xmin, xmax, self.pixelWidth())
+        else:
+            index = m4_indices(self.xval, self.yval, xmin, xmax, self.pixelWidth())
+        index = np.union1d(index, self._anchors)
+        self.item.setData(self.xval[index], self.yval[index])
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# File: funcstream.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module with incremental generators for uniformly sampled functions """
+
+import numpy as np
+
+
+class FunctionStream:
+    """Generator of func(x) on the grid x = x0 + n * step, n = 1, 2, ...
+
+    The stream continues after x0, the last sample already in the window,
+    and only the samples that enter the window are evaluated. The abscissa
+    is computed from the integer sample index, so it does not accumulate the
+    rounding error of repeated additions."""
+
+    def __init__(self, func, x0, step):
+        self.func = func
+        self.x0 = x0
+        self.step = step
+        self.index = 0  # index of the last generated sample
+
+    def abscissa(self, count):
+        """Return the abscissa of the next count samples."""
+        return self.x0 + self.step * np.arange(self.index + 1, self.index + count + 1)
+
+    def take(self, count):
+        """Return the next count samples as (x, y) arrays."""
+        xval = self.abscissa(count)
+        self.index += count
+        return xval, self.func(xval)
+
+
+class HarmonicStream(FunctionStream):
+    """Generator of amplitude * exp(i * omega * x) on the grid of FunctionStream.
+
+    Successive samples are obtained by rotating the phasor through the
+    constant angle omega * step, which costs one complex multiplication per
+    sample instead of a call to sin/cos. The rounding error of the rotation
+    grows linearly, so the phasor is resynchronised from the exact phase
+    every `resync` samples and its modulus is renormalised on every batch."""
+
+    def __init__(self, x0, step, omega=1.0, amplitude=1.0, resync=4096):
+        super().__init__(None, x0, step)
+        self.omega = omega
+        self.amplitude = amplitude
+        self.resync = resync
+        self._table = np.ones(1, dtype=np.complex128)
+        self._phasor = self._exact(0)
+
+    def _exact(self, index):
+        """Return the phasor of the sample index computed from its phase."""
+        return np.exp(1j * self.omega * (self.x0 + self.step * index))
+
+    def _rotations(self, count):
+        """Return exp(i * omega * step * k) for k = 1..count."""
+        if self._table.size <= count:
+            # double the cached table of rotations instead of growing it by one
+            size = max(count + 1, 2 * self._table.size)
+            self._table = np.exp(1j * self.omega * self.step * np.arange(size))
+        return self._table[1 : count + 1]
+
+    def _take(self, count):
+        """Return the next count phasors of unit modulus."""
+        if self.index // self.resync != (self.index + count) // self.resync:
+            # resynchronise the last generated sample to its exact phase
+            self._phasor = self._exact(self.index)
+        else:
+            self._phasor /= abs(self._phasor)
+        phasor = self._phasor * self._rotations(count)
+        self._phasor = phasor[-1]
+        self.index += count
+        return phasor
+
+    def take(self, count):
+        """Return the next count samples as (x, sin, cos) arrays."""
+        xval = self.abscissa(count)
+        phasor = self.amplitude * self._take(count)
+        return xval, phasor.imag, phasor.real
+
+    def take_sin(self, count):
+        """Return the next count samples as (x, sin) arrays."""
+        xval, sval, _ = self.take(count)
+        return xval, sval
+
+    def take_cos(self, count):
+        """Return the next count samples as (x, cos) arrays."""
+        xval, _, cval = self.take(count)
+        return xval, cval
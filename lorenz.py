@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# File: lorenz.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module to integrate ensembles of Lorenz system trajectories with NumPy """
+
+import numpy as np
+
+from precision import float_dtype
+from streambuffer import SlidingSeries
+
+SIGMA, BETA, RHO = 10.0, 8.0 / 3.0, 28.0
+
+
+def lorenz(state, out, sigma=SIGMA, rho=RHO, beta=BETA):
+    """Write the time derivative of the (M, 3) state array into out.
+
+    sigma, rho and beta are scalars or arrays of shape (M,) to give every
+    trajectory of the ensemble its own parameters."""
+    xval, yval, zval = state[:, 0], state[:, 1], state[:, 2]
+    out[:, 0] = sigma * (yval - xval)
+    out[:, 1] = xval * (rho - zval) - yval
+    out[:, 2] = xval * yval - beta * zval
+    return out
+
+
+def euler_step(state, delt, work, **params):
+    """Advance the (M, 3) state array in place by one forward Euler step."""
+    state += delt * lorenz(state, work[0], **params)
+    return state
+
+
+def rk4_step(state, delt, work, **params):
+    """Advance the (M, 3) state array in place by one classical RK4 step."""
+    k1, k2, k3, k4, temp = work
+    lorenz(state, k1, **params)
+    np.multiply(k1, 0.5 * delt, out=temp)
+    temp += state
+    lorenz(temp, k2, **params)
+    np.multiply(k2, 0.5 * delt, out=temp)
+    temp += state
+    lorenz(temp, k3, **params)
+    np.multiply(k3, delt, out=temp)
+    temp += state
+    lorenz(temp, k4, **params)
+    k2 += k3
+    k1 += k4
+    k1 += 2.0 * k2
+    state += (delt / 6.0) * k1
+    return state
+
+
+STEPPERS = {"euler": (euler_step, 1), "rk4": (rk4_step, 5)}
+
+
+def integrate(state0, nstep, delt=0.01, method="euler", out=None, **params):
+    """Integrate an ensemble of trajectories from the initial conditions state0.
+
+    state0 has shape (M, 3) or (3,) for a single trajectory. The trajectory,
+    initial condition included, is written into out of shape (nstep, M, 3),
+    which is allocated in the dtype of the precision policy if not given,
+    and returned, the steps are taken in the dtype of out. Every step advances
+    the whole ensemble with a handful of vectorised operations, so integrating
+    thousands of trajectories costs about as much as integrating one."""
+    if method not in STEPPERS:
+        raise ValueError(f"unknown method {method!r}, expected one of {list(STEPPERS)}")
+    step, nwork = STEPPERS[method]
+    if nstep < 1:
+        raise ValueError(f"nstep must be at least 1, got {nstep}")
+
+    dtype = float_dtype() if out is None else out.dtype
+    state = np.array(state0, dtype=dtype, ndmin=2)
+    if out is None:
+        out = np.empty((nstep,) + state.shape, dtype=state.dtype)
+    elif out.shape != (nstep,) + state.shape:
+        raise ValueError(
+            f"out has shape {out.shape}, expected {(nstep,) + state.shape}"
+        )
+
+    work = np.empty((nwork,) + state.shape, dtype=state.dtype)
+    out[0] = state
+    for n in range(1, nstep):
+        out[n] = step(state, delt, work, **params)
+    return out
+
+
+class LorenzStream:
+    """Lazily integrated Lorenz trajectory revealed a point at a time.
+
+    The trajectory is integrated ahead in chunks only as far as the reveal
+    cursor needs plus a lookahead, and kept in growing SlidingSeries, so the
+    memory scales with the number of points shown instead of with nstep.
+    The points are integrated and kept in dtype, that of the policy by default."""
+
+    def __init__(
+        self,
+        state0,
+        nstep,
+        delt=0.01,
+        method="euler",
+        chunk=256,
+        lookahead=256,
+        dtype=None,
+        **params,
+    ):
+        self.nstep = nstep
+        self.delt = delt
+        self.method = method
+        self.chunk = chunk
+        self.lookahead = lookahead
+        self.params = params
+        self._state = np.array(state0, dtype=float_dtype(dtype), ndmin=2)
+        self._out = np.empty((chunk + 1,) + self._state.shape, dtype=self._state.dtype)
+
+        self.xval, self.yval, self.zval = [
+            SlidingSeries(dtype=self._state.dtype) for _ in range(3)
+        ]
+        self._append(self._state[np.newaxis])
+
+    def __len__(self):
+        """Return the number of points integrated so far."""
+        return len(self.xval)
+
+    def _append(self, states):
+        """Append (n, 1, 3) states of the first trajectory to the series."""
+        self.xval.extend(states[:, 0, 0])
+        self.yval.extend(states[:, 0, 1])
+        self.zval.extend(states[:, 0, 2])
+
+    def advance_to(self, count):
+        """Make sure the first count points, clipped to nstep, are integrated."""
+        target = min(self.nstep, count + self.lookahead)
+        while len(self) < target:
+            nval = min(self.chunk, self.nstep - len(self))
+            out = self._out[: nval + 1]
+            integrate(self._state, nval + 1, self.delt, self.method, out, **self.params)
+            self._state = out[-1].copy()
+            self._append(out[1:])
+
+    def take(self, count):
+        """Integrate the next count points past nstep and return them.
+
+        The points continue the trajectory after the last one integrated
+        and are not kept in the series, so a consumer keeping a window of
+        its own (the trail mode) can run indefinitely in constant memory."""
+        if count <= self.chunk:
+            out = self._out[: count + 1]
+        else:
+            # in the dtype of the stream, not of the precision policy
+            out = np.empty((count + 1,) + self._state.shape, dtype=self._state.dtype)
+        integrate(self._state, count + 1, self.delt, self.method, out, **self.params)
+        self._state = out[count].copy()
+        states = out[1 : count + 1, 0]
+        return states[:, 0].copy(), states[:, 1].copy(), states[:, 2].copy()
+
+    def view(self, count):
+        """Return the first count points as (x, y, z) arrays."""
+        self.advance_to(count)
+        return (
+            self.xval.view()[:count],
+            self.yval.view()[:count],
+            self.zval.view()[:count],
+        )
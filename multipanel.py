@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# File: multipanel.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module to batch the per-tick updates of multi-panel plot windows """
+
+
+class BatchUpdate:
+    """Context deferring curve and range changes of a multi-panel view.
+
+    Inside the context setData, setXRange and setYRange are recorded
+    instead of applied, a later change of the same curve or axis replacing
+    an earlier one. On leaving the outermost context the changes are
+    applied with the view updates disabled, the X and Y ranges of a panel
+    in a single setRange call, and the view is repainted once."""
+
+    def __init__(self, view):
+        self.view = view  # GraphicsLayoutWidget holding the panels
+        self._depth = 0
+        self._curves = {}
+        self._ranges = {}
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0:
+            self.apply()
+        return False
+
+    def setData(self, curve, *args, **kwargs):
+        """Set the data of a curve of one of the panels."""
+        self._curves[curve] = (args, kwargs)
+        if not self._depth:
+            self.apply()
+
+    def _setRange(self, plot, axis, vmin, vmax, padding):
+        """Record the padded range of one axis of a panel."""
+        viewbox = plot.getViewBox() if hasattr(plot, "getViewBox") else plot
+        if padding is None:
+            padding = viewbox.suggestPadding(0 if axis == "xRange" else 1)
+        span = (vmax - vmin) * padding
+        self._ranges.setdefault(viewbox, {})[axis] = (vmin - span, vmax + span)
+        if not self._depth:
+            self.apply()
+
+    def setXRange(self, plot, vmin, vmax, padding=None):
+        """Set the visible X range of a panel (PlotItem or ViewBox)."""
+        self._setRange(plot, "xRange", vmin, vmax, padding)
+
+    def setYRange(self, plot, vmin, vmax, padding=None):
+        """Set the visible Y range of a panel (PlotItem or ViewBox)."""
+        self._setRange(plot, "yRange", vmin, vmax, padding)
+
+    def apply(self):
+        """Apply the recorded changes in one update of the view."""
+        curves, self._curves = self._curves, {}
+        ranges, self._ranges = self._ranges, {}
+        if not curves and not ranges:
+            return
+
+        self.view.setUpdatesEnabled(False)
+        try:
+            for curve, (args, kwargs) in curves.items():
+                curve.setData(*args, **kwargs)
+            for viewbox, axes in ranges.items():
+                viewbox.setRange(padding=0, **axes)
+        finally:
+            self.view.setUpdatesEnabled(True)
+        self.view.viewport().update()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# File: multiseries.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module to draw many series of the same style as a single plot item """
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt6 import QtCore
+
+from precision import float_dtype
+
+
+class MergedCurve:
+    """Many series of one style drawn by a single PlotDataItem.
+
+    The visible series are packed into one vertex array, a connect array
+    breaks the line between the last point of a series and the first of
+    the next one, so the draw cost grows with the points and not with the
+    number of series. Changes are collected and the vertex array is built
+    once on the next pass of the event loop, or by apply().
+
+    The legend of the plot, if any, gets an entry for the first `legend`
+    series only, built when they are first drawn, and one line counting
+    the others. Clicking the sample of an entry shows or hides its series."""
+
+    def __init__(self, plot, legend=20, **kwargs):
+        self.plot = plot
+        self.style = kwargs
+        self.item = plot.plot(**kwargs)
+        self.limit = legend
+        self.xval = []
+        self.yval = []
+        self.names = []
+        self.visible = []
+        self._pending = False
+        self._entries = []  # legend samples of the first series
+        self._more = None  # legend sample counting the other series
+
+    def __len__(self):
+        return len(self.yval)
+
+    def add(self, xval, yval, name=None):
+        """Add a series, return its index."""
+        self.xval.append(np.asarray(xval, dtype=float_dtype()))
+        self.yval.append(np.asarray(yval, dtype=float_dtype()))
+        self.names.append(name if name is not None else f"Series {len(self.yval)}")
+        self.visible.append(True)
+        self._schedule()
+        return len(self.yval) - 1
+
+    def setData(self, index, xval, yval):
+        """Replace the points of a series."""
+        self.xval[index] = np.asarray(xval, dtype=float_dtype())
+        self.yval[index] = np.asarray(yval, dtype=float_dtype())
+        self._schedule()
+
+    def setVisible(self, index, visible):
+        """Show or hide a series."""
+        if self.visible[index] == visible:
+            return
+        self.visible[index] = visible
+        if index < len(self._entries):
+            self._entries[index].setVisible(visible)
+        self._schedule()
+
+    def isVisible(self, index):
+        """Return whether a series is shown."""
+        return self.visible[index]
+
+    def _schedule(self):
+        """Build the vertex array once for every change until the next pass."""
+        if not self._pending:
+            self._pending = True
+            QtCore.QTimer.singleShot(0, self.apply)
+
+    def apply(self):
+        """Pack the visible series into the vertex array of the item."""
+        self._pending = False
+        shown = [index for index, visible in enumerate(self.visible) if visible]
+        if shown:
+            xval = np.concatenate([self.xval[index] for index in shown])
+            yval = np.concatenate([self.yval[index] for index in shown])
+            # no segment from the last point of a series to the next series
+            connect = np.ones(len(xval), dtype=bool)
+            connect[np.cumsum([len(self.xval[index]) for index in shown]) - 1] = False
+        else:
+            xval = yval = connect = np.empty(0)
+        self.item.setData(xval, yval, connect=connect)
+        self._legend()
+
+    def _legend(self):
+        """Add the legend entries of the series added since the last call."""
+        legend = getattr(self.plot, "plotItem", self.plot).legend
+        if legend is None:
+            return
+        style = {key: value for key, value in self.style.items() if key != "name"}
+        for index in range(len(self._entries), min(len(self), self.limit)):
+            # a sample item outside of the scene stands for its series
+            sample = pg.PlotDataItem(**style)
+            sample.setVisible(self.visible[index])
+            sample.visibleChanged.connect(
+                lambda index=index, sample=sample: self.setVisible(
+                    index, sample.isVisible()
+                )
+            )
+            legend.addItem(sample, self.names[index])
+            self._entries.append(sample)
+
+        hidden = len(self) - len(self._entries)
+        if hidden > 0:
+            text = f"and {hidden} more series"
+            if self._more is None:
+                self._more = pg.PlotDataItem(**style)
+                legend.addItem(self._more, text)
+            else:
+                legend.getLabel(self._more).setText(text)
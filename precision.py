@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# File: precision.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module with the floating point precision policy of the plot data """
+
+import os
+
+import numpy as np
+
+DTYPES = ("float32", "float64")
+
+# largest magnitude of a rebased x value, about 1/8000 of a unit is resolved
+REBASE = {"float32": 1024.0, "float64": None}
+
+_dtype = np.dtype(np.float64)
+
+
+def float_dtype(dtype=None):
+    """Return dtype, or the dtype of the policy when dtype is None."""
+    return _dtype if dtype is None else np.dtype(dtype)
+
+
+def set_float_dtype(dtype):
+    """Store the data of the buffers, integrators and sources as dtype.
+
+    float32 halves the memory of the series and the bytes every setData
+    copies, float64 (the default) keeps the full precision. The policy can
+    also be set with the PYQTPLOT_DTYPE environment variable, it applies to
+    the buffers created after the call."""
+    global _dtype
+    dtype = np.dtype(dtype)
+    if dtype.name not in DTYPES:
+        raise ValueError(f"unsupported dtype {dtype.name!r}, expected one of {DTYPES}")
+    _dtype = dtype
+
+
+def rebase_limit(dtype=None):
+    """Return the magnitude past which growing x values are rebased, or None.
+
+    A float32 x of 100000 is only resolved to 1/128, so a window scrolling
+    in steps of 0.01 would be drawn in visible stairs. Buffers storing x
+    relative to an origin keep it below this limit instead."""
+    return REBASE[float_dtype(dtype).name]
+
+
+set_float_dtype(os.environ.get("PYQTPLOT_DTYPE", "float64"))
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# File: probe.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module to time the phases of every tick of the updating plot windows """
+
+import atexit
+import contextlib
+import csv
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import pyqtgraph as pg
+from PyQt6 import QtGui
+
+from chrome import plot_items
+
+PHASES = ("data", "range", "setData", "paint")
+FIXED = QtGui.QFontDatabase.SystemFont.FixedFont
+
+_NULL = contextlib.nullcontext()  # span of a disabled probe
+_logs = {}  # path: TickLog shared by the windows of the process
+
+
+class TickLog:
+    """Rows of tick timings written to a CSV file, or JSON lines for .jsonl."""
+
+    def __init__(self, path, fields):
+        self.path = path
+        self.jsonl = path.endswith(".jsonl")
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = None
+        if not self.jsonl:
+            self.writer = csv.DictWriter(self.file, fields)
+            self.writer.writeheader()
+
+    def write(self, row):
+        """Append one row, buffered until flush or close."""
+        if self.jsonl:
+            self.file.write(json.dumps(row) + "\n")
+        else:
+            self.writer.writerow(row)
+
+    def flush(self):
+        """Write the buffered rows to the file."""
+        self.file.flush()
+
+    def close(self):
+        """Flush and close the file."""
+        self.file.close()
+
+
+class _Span:
+    """Context manager adding the time spent in its block to a phase."""
+
+    __slots__ = ("times", "phase", "start")
+
+    def __init__(self, times, phase):
+        self.times = times
+        self.phase = phase
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.times[self.phase] += time.perf_counter() - self.start
+
+
+class TickProbe:
+    """Timings of the phases of every tick of one window.
+
+    The window calls begin() at the start of every tick and wraps its data
+    generation, range computation and setData in span(phase); the paint
+    of the view is timed by wrapping its paintEvent. A tick ends where the
+    next one begins, so the row of a tick holds the repaint it caused and
+    is written to the log one tick late. Every row also counts the Python
+    memory blocks allocated by the tick, and with trace=True the peak of
+    the bytes traced by tracemalloc, NumPy buffers included.
+
+    With hud=True the mean of the phases is shown over the top left corner
+    of the plot, updated every `interval` milliseconds, and F9 on the view
+    shows or hides it. A disabled probe hands out one shared empty context
+    manager, does not wrap paintEvent and returns from begin() at once."""
+
+    def __init__(self, view, name="", log=None, hud=False, trace=False, interval=250):
+        self.view = view
+        self.name = name
+        self.log = log
+        self.trace = trace
+        self.interval = interval / 1000
+        self.enabled = False
+        self.ticks = 0
+
+        self._times = dict.fromkeys(PHASES, 0.0)
+        self._spans = {phase: _Span(self._times, phase) for phase in PHASES}
+        self._started = None  # perf_counter of the current tick
+        self._frames = 0
+        self._blocks = 0
+        self._traced = 0
+        self._sums = dict.fromkeys(PHASES, 0.0)
+        self._summed = 0  # ticks in the sums shown by the HUD
+        self._shown = 0.0
+
+        self.hud = pg.TextItem(color="#dcdcdc", anchor=(0, 0))
+        self.hud.setParentItem(plot_items(view)[0].vb)
+        self.hud.setZValue(1e6)
+        self.hud.setFont(QtGui.QFontDatabase.systemFont(FIXED))
+        self.hud.setVisible(hud)
+        self._shortcut = QtGui.QShortcut(QtGui.QKeySequence("F9"), view)
+        self._shortcut.activated.connect(self.toggleHud)
+
+        if log is not None or hud:
+            self.setEnabled(True)
+
+    def setEnabled(self, enabled):
+        """Start or stop timing the ticks and the paint of the view."""
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        self._started = None
+        if enabled:
+            paintEvent = self.view.paintEvent
+
+            def timed(event):
+                start = time.perf_counter()
+                paintEvent(event)
+                self._times["paint"] += time.perf_counter() - start
+
+            # the instance attribute overrides the virtual method
+            self.view.paintEvent = timed
+            if self.trace and not tracemalloc.is_tracing():
+                tracemalloc.start()
+        else:
+            del self.view.paintEvent
+            if self.log is not None:
+                self.log.flush()
+
+    def toggleHud(self):
+        """Show or hide the overlay, timing the ticks while it is shown."""
+        self.hud.setVisible(not self.hud.isVisible())
+        if self.hud.isVisible():
+            self.setEnabled(True)
+        elif self.log is None:
+            self.setEnabled(False)
+
+    def span(self, phase):
+        """Return a context manager timing its block as part of a phase."""
+        return self._spans[phase] if self.enabled else _NULL
+
+    def begin(self, frames=1):
+        """Start a tick merging frames, ending the previous one."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._started is not None:
+            self._end(now)
+        for phase in PHASES:
+            self._times[phase] = 0.0
+        self._started = now
+        self._frames = frames
+        self._blocks = sys.getallocatedblocks()
+        if self.trace:
+            tracemalloc.reset_peak()
+            self._traced = tracemalloc.get_traced_memory()[0]
+
+    def _end(self, now):
+        """Record the tick that started last, show it on the HUD if due."""
+        self.ticks += 1
+        if self.log is not None:
+            row = {
+                "window": self.name,
+                "tick": self.ticks,
+                "time": round(self._started, 6),
+                "frames": self._frames,
+            }
+            for phase in PHASES:
+                row[f"{phase}_ms"] = round(1e3 * self._times[phase], 4)
+            row["blocks"] = sys.getallocatedblocks() - self._blocks
+            if self.trace:
+                row["alloc_kb"] = round(
+                    (tracemalloc.get_traced_memory()[1] - self._traced) / 1024, 1
+                )
+            self.log.write(row)
+
+        if self.hud.isVisible():
+            for phase in PHASES:
+                self._sums[phase] += self._times[phase]
+            self._summed += 1
+            if now - self._shown >= self.interval:
+                self._show(now)
+
+    def _show(self, now):
+        """Write the mean phase times since the last update on the HUD."""
+        lines = [
+            f"{phase:<8}{1e3 * self._sums[phase] / self._summed:7.3f} ms"
+            for phase in PHASES
+        ]
+        lines.append(f"{'ticks':<8}{self.ticks:7d}")
+        self.hud.setText("\n".join(lines))
+        self._sums = dict.fromkeys(PHASES, 0.0)
+        self._summed = 0
+        self._shown = now
+
+    def close(self):
+        """Stop timing and flush the log."""
+        self.setEnabled(False)
+
+
+def window_probe(view, name=""):
+    """Return the TickProbe of a window as configured by PYQTPLOT_PROBE.
+
+    The variable is a comma separated list of "hud", "trace" and the path
+    of a .csv or .jsonl log shared by every window of the process, e.g.
+    PYQTPLOT_PROBE=hud,ticks.csv. Unset, the probe is disabled until F9."""
+    options = [item for item in os.environ.get("PYQTPLOT_PROBE", "").split(",") if item]
+    log = None
+    for item in options:
+        if item.endswith((".csv", ".jsonl")):
+            fields = ["window", "tick", "time", "frames"]
+            fields += [f"{phase}_ms" for phase in PHASES] + ["blocks", "alloc_kb"]
+            if item not in _logs:
+                _logs[item] = TickLog(item, fields)
+            log = _logs[item]
+    return TickProbe(view, name, log, hud="hud" in options, trace="trace" in options)
+
+
+@atexit.register
+def _close_logs():
+    """Close the logs, writing the rows still buffered."""
+    for log in _logs.values():
+        log.close()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# File: progressive.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module with an append-only curve for the progressively revealed plots """
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt6 import QtWidgets
+
+CACHE = QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache
+
+
+class _TailItem(pg.PlotDataItem):
+    """Tail item whose bounds also cover the frozen points of its curve."""
+
+    def __init__(self, curve, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._curve = curve
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        """Return the bounds of the tail joined with those of the frozen points.
+
+        The frozen points are always included whole, frac and orthoRange
+        only narrow the bounds of the tail."""
+        lo, hi = super().dataBounds(ax, frac, orthoRange)
+        bounds = self._curve.bounds
+        if bounds is None:
+            return lo, hi
+        if lo is None:
+            return tuple(bounds[ax])
+        return min(lo, bounds[ax][0]), max(hi, bounds[ax][1])
+
+
+class ProgressiveCurve:
+    """Append-only curve drawn as frozen chunks plus a growing tail.
+
+    setData accepts the same growing prefix (x[0:n], y[0:n]) the reveal
+    animations pass every tick, but only the points after the last full
+    chunk are handed to the tail item. A completed chunk is frozen, and
+    frozen items of the same size are merged like the digits of a binary
+    counter up to `merge` chunks, so a tick copies at most merge * chunk
+    points and n points are drawn by n / (merge * chunk) + log2(merge)
+    items. Every frozen item
+    is rasterised once into a pixmap it is blitted from while the view
+    range is unchanged (cache=False draws them anew every frame).
+
+    The frozen items are added with ignoreBounds and their running bounds
+    are reported by the tail, so the autorange of the view does not walk
+    the frozen items, and the per-tick cost does not depend on how much
+    of the curve has already been drawn."""
+
+    def __init__(self, plot, chunk=512, name=None, cache=True, merge=64, **kwargs):
+        self.plot = plot  # PlotWidget or PlotItem the curve is drawn on
+        self.chunk = chunk
+        self.merge = merge  # chunks of the largest merged item
+        self.cache = cache
+        self.kwargs = kwargs
+        self.frozen = []  # merged items from the oldest points on
+        self.bounds = None  # ((xmin, xmax), (ymin, ymax)) of the frozen points
+        self._data = []  # (xval, yval, chunks) drawn by every frozen item
+        self._start = 0  # index of the first point of the tail
+        self._count = 0  # number of points drawn
+
+        # only the tail carries the name, so the legend gets a single entry
+        self.tail = _TailItem(self, name=name, **kwargs)
+        plot.addItem(self.tail)
+
+    def _freeze(self, xval, yval):
+        """Draw one completed chunk, merging the frozen items of equal size."""
+        xval, yval = np.array(xval), np.array(yval)
+        bounds = [(np.nanmin(values), np.nanmax(values)) for values in (xval, yval)]
+        if self.bounds is not None:
+            bounds = [
+                (min(lo, old[0]), max(hi, old[1]))
+                for (lo, hi), old in zip(bounds, self.bounds)
+            ]
+        self.bounds = tuple((float(lo), float(hi)) for lo, hi in bounds)
+
+        chunks = 1
+        while self._data and self._data[-1][2] == chunks < self.merge:
+            # the previous item ends on the first point of this one
+            xold, yold, _ = self._data.pop()
+            self.plot.removeItem(self.frozen.pop())
+            xval = np.concatenate((xold, xval[1:]))
+            yval = np.concatenate((yold, yval[1:]))
+            chunks *= 2
+
+        item = pg.PlotDataItem(xval, yval, **self.kwargs)
+        if self.cache:
+            item.curve.setCacheMode(CACHE)
+        self.plot.addItem(item, ignoreBounds=True)
+        self.frozen.append(item)
+        self._data.append((xval, yval, chunks))
+
+    def setData(self, xval, yval):
+        """Draw the prefix (xval, yval), which extends the previous one."""
+        count = len(xval)
+        if count < self._count:
+            self.clear()
+
+        # consecutive chunks share their end point to keep the line connected
+        while count - self._start > self.chunk:
+            end = self._start + self.chunk + 1
+            self._freeze(xval[self._start : end], yval[self._start : end])
+            self._start += self.chunk
+
+        self.tail.setData(xval[self._start : count], yval[self._start : count])
+        self._count = count
+
+    def clear(self):
+        """Remove every frozen item and empty the tail."""
+        for item in self.frozen:
+            self.plot.removeItem(item)
+        self.frozen.clear()
+        self._data.clear()
+        self.bounds = None
+        self._start = 0
+        self._count = 0
+        self.tail.setData([], [])
+
+    def setPen(self, *args, **kwargs):
+        """Set the pen of the tail and of every frozen item."""
+        self.kwargs["pen"] = pg.mkPen(*args, **kwargs)
+        for item in (self.tail, *self.frozen):
+            item.setPen(self.kwargs["pen"])
@@ -31,16 +31,24 @@ class MainWindow(QtWidgets.QMainWindow):
         self.graphWidget.plot(hour, temperature)
 
 
+def create_window():
+    """Create the main window with the data to plot, hidden by default."""
+
+    hour = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    temperature = [30, 32, 34, 32, 33, 31, 29, 32, 35, 45]
+
+    window = MainWindow(hour, temperature)  # an instance of the class MainWindow
+
+    return window
+
+
 def main():
     """Need one (and only one) QApplication instance per application.
     Pass in sys.argv to allow command line arguments for the application.
     If no command line arguments than QApplication([]) is required."""
     app = QtWidgets.QApplication(sys.argv)
 
-    hour = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-    temperature = [30, 32, 34, 32, 33, 31, 29, 32, 35, 45]
-
-    window = MainWindow(hour, temperature)  # an instance of the class MainWindow
+    window = create_window()
     window.show()  # windows are hidden by default
 
     sys.exit(app.exec())  # start the event loop
@@ -10,12 +10,16 @@ import sys
 import pyqtgraph as pg
 from PyQt6 import QtCore, QtWidgets
 
+from decimate import DecimatedCurve
+from multiseries import MergedCurve
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """Subclass of QMainWindow to customize application's main window."""
 
     def __init__(self):
         super().__init__()
+        self.curves = []
 
         # set the size parameters (width, height) pixels
         self.setFixedSize(QtCore.QSize(640, 480))
@@ -56,22 +60,44 @@ class MainWindow(QtWidgets.QMainWindow):
         # set line color in hex notation as string, line width in pixels, line style
         lvalue = pg.mkPen(color=lcolor, width=1, style=QtCore.Qt.PenStyle.SolidLine)
 
-        self.graphWidget.plot(
+        # min/max pyramid built once per series for fast zoom and pan
+        curve = DecimatedCurve(
+            self.graphWidget,
             abscissa,
             ordinate,
+            pyramid=True,
             name=legend,
             pen=lvalue,
             symbol="+",
             symbolSize=8,
             symbolBrush=(scolor),
         )
+        self.curves.append(curve)
+        return curve
 
+    def graphSeries(self, abscissa, ordinates, legends, lcolor, scolor):
+        """plot data: many ordinates over the abscissa drawn
+        as one item with the same line and marker '+'"""
 
-def main():
-    """Need one (and only one) QApplication instance per application.
-    Pass in sys.argv to allow command line arguments for the application.
-    If no command line arguments than QApplication([]) is required."""
-    app = QtWidgets.QApplication(sys.argv)
+        # set line color in hex notation as string, line width in pixels, line style
+        lvalue = pg.mkPen(color=lcolor, width=1, style=QtCore.Qt.PenStyle.SolidLine)
+
+        # one vertex array for every series, the legend lists the first ones
+        curve = MergedCurve(
+            self.graphWidget,
+            pen=lvalue,
+            symbol="+",
+            symbolSize=8,
+            symbolBrush=(scolor),
+        )
+        for ordinate, legend in zip(ordinates, legends):
+            curve.add(abscissa, ordinate, legend)
+        self.curves.append(curve)
+        return curve
+
+
+def create_window():
+    """Create the main window with the data to plot, hidden by default."""
 
     hour = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     temperature_1 = [30, 32, 34, 32, 33, 31, 29, 32, 35, 45]
@@ -80,6 +106,17 @@ def main():
     window = MainWindow()  # an instance of the class MainWindow
     window.graphPlot(hour, temperature_1, "Sensor 1", "#d81b60", "#004d40")
     window.graphPlot(hour, temperature_2, "Sensor 2", "#1e88e5", "#ffc107")
+
+    return window
+
+
+def main():
+    """Need one (and only one) QApplication instance per application.
+    Pass in sys.argv to allow command line arguments for the application.
+    If no command line arguments than QApplication([]) is required."""
+    app = QtWidgets.QApplication(sys.argv)
+
+    window = create_window()
     window.show()  # windows are hidden by default
 
     sys.exit(app.exec())  # start the event loop
@@ -8,17 +8,37 @@
 import sys
 from random import randint
 
+import numpy as np
 import pyqtgraph as pg
 from PyQt6 import QtCore, QtWidgets
 
+from chrome import cache_chrome
+from datasource import RandomSource
+from precision import rebase_limit
+from probe import window_probe
+from recording import Recorder, ReplaySource
+from scheduler import shared_scheduler
+from streambuffer import RingBuffer
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """Subclass of QMainWindow to customize application's main window."""
 
-    def __init__(self, xval, yval):
+    def __init__(self, xval, yval, source, recorder=None):
         super().__init__()
-        self.xval = xval
-        self.yval = yval
+        self.source = source
+        self.recorder = recorder
+
+        # preallocated circular buffers sized to the scrolling window,
+        # x is stored relative to an origin so it stays precise as it grows
+        self.xval = RingBuffer(len(xval), rebase=rebase_limit())
+        self.yval = RingBuffer(len(yval))
+        self.xval.extend(xval)
+        self.yval.extend(yval)
+
+        # the initial window is the first tick of a recording
+        if self.recorder is not None:
+            self.recorder.write(xval, yval)
 
         # set the size parameters (width, height) pixels
         self.setFixedSize(QtCore.QSize(640, 480))
@@ -50,23 +70,79 @@ class MainWindow(QtWidgets.QMainWindow):
         lvalue = pg.mkPen(color="#77ab56", width=1, style=QtCore.Qt.PenStyle.SolidLine)
 
         # plot data: x, y values with lines drawn using Qt's QPen types
-        self.data_line = self.graphWidget.plot(self.xval, self.yval, pen=lvalue)
+        self.data_line = self.graphWidget.plot(
+            self.xval.view(), self.yval.view(), pen=lvalue
+        )
+        self.data_line.setPos(self.xval.origin, 0)
+
+        # samples are acquired on a worker thread of the data source
+        self.source.start()
+
+        # title, y axis and legend drawn from cached pixmaps, x scrolls every tick
+        cache_chrome(self.graphWidget, moving=("bottom",))
+
+        # timings of the phases of every tick, off unless PYQTPLOT_PROBE is set
+        self.probe = window_probe(self.graphWidget, "pyqtplot11")
+
+        # frames of the shared scheduler, missed frames are merged
+        self.timer = shared_scheduler().add(self.update_data_line)
+
+    def update_data_line(self, frames=1):
+        """Method uses the frame scheduler to update the data every 50ms,
+        every sample the data source produced meanwhile is drained at once."""
+        self.probe.begin(frames)
+
+        with self.probe.span("data"):
+            yval = self.source.read()
+            if not yval.size:
+                return
+
+            xval = self.xval.last() + np.arange(1, yval.size + 1)
+            self.xval.extend(xval)
+            self.yval.extend(yval)
 
-        self.timer = QtCore.QTimer()
-        self.timer.setInterval(50)
-        self.timer.timeout.connect(self.update_data_line)
-        self.timer.start()
+            if self.recorder is not None:
+                self.recorder.write(xval, yval)
 
-    def update_data_line(self):
-        """Method uses QTimer to update the data every 50ms."""
+        # the curve is moved by the origin of the relative x values
+        with self.probe.span("setData"):
+            self.data_line.setPos(self.xval.origin, 0)
+            self.data_line.setData(self.xval.view(), self.yval.view())
 
-        self.xval = self.xval[1:]
-        self.xval.append(self.xval[-1] + 1)
+    def closeEvent(self, event):
+        """Method stops the updates, the data source and the recorder on
+        closing the window."""
+        self.timer.stop()
+        self.source.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        super().closeEvent(event)
 
-        self.yval = self.yval[1:]
-        self.yval.append(randint(0, 100))
 
-        self.data_line.setData(self.xval, self.yval)
+def create_window(record=None, replay=None, speed=1.0, seek=0.0):
+    """Create the main window with the data to plot, hidden by default.
+    The session is recorded to the file record, or the recorded session
+    replay is played back at speed times real time from seek seconds on."""
+
+    if replay is not None:
+        # the window starts with the samples recorded up to seek
+        source = ReplaySource(replay, speed, field="y", seek=seek)
+        history = source.history(100)
+        window = MainWindow(history["x"], history["y"], source)
+        return window
+
+    xval = list(range(100))
+    yval = [randint(0, 100) for _ in xval]
+
+    # random integers produced at one sample per 50ms frame
+    source = RandomSource(rate=20, low=0, high=100)
+
+    recorder = None if record is None else Recorder(record, ("x", "y"))
+
+    # an instance of the class MainWindow
+    window = MainWindow(xval, yval, source, recorder)
+
+    return window
 
 
 def main():
@@ -75,10 +151,7 @@ def main():
     If no command line arguments than QApplication([]) is required."""
     app = QtWidgets.QApplication(sys.argv)
 
-    xval = list(range(100))
-    yval = [randint(0, 100) for _ in xval]
-
-    window = MainWindow(xval, yval)  # an instance of the class MainWindow
+    window = create_window()
     window.show()  # windows are hidden by default
 
     sys.exit(app.exec())  # start the event loop
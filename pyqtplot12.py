@@ -11,15 +11,33 @@ import numpy as np
 import pyqtgraph as pg
 from PyQt6 import QtCore, QtWidgets
 
+from chrome import cache_chrome
+from precision import rebase_limit
+from probe import window_probe
+from recording import Recorder, ReplaySource
+from scheduler import shared_scheduler
+from streambuffer import SlidingSeries
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """Subclass of QMainWindow to customize application's main window."""
 
-    def __init__(self, xval, yval, step):
+    def __init__(self, xval, yval, step, source=None, recorder=None):
         super().__init__()
-        self.xval = xval
-        self.yval = yval
         self.step = step
+        self.source = source
+        self.recorder = recorder
+
+        # sliding window series with amortized O(1) append and y extrema,
+        # x is stored relative to an origin so it stays precise as it grows
+        self.xval = SlidingSeries(len(xval), rebase=rebase_limit())
+        self.yval = SlidingSeries(len(yval), extrema=True)
+        self.xval.extend(xval)
+        self.yval.extend(yval)
+
+        # the initial window is the first tick of a recording
+        if self.recorder is not None:
+            self.recorder.write(xval, yval)
 
         # set the size parameters (width, height) pixels
         self.setFixedSize(QtCore.QSize(640, 480))
@@ -45,40 +63,99 @@ class MainWindow(QtWidgets.QMainWindow):
         self.graphWidget.showGrid(x=True, y=True, alpha=0.5)
 
         # graphPlot method call
-        self.graphPlot(self.xval, self.yval)
+        self.graphPlot(self.xval.view(), self.yval.view())
 
     def graphPlot(self, xval, yval):
         """Method accepts x and y parameters to plot."""
 
         # set the axis limits within the specified ranges and padding
-        self.graphWidget.setXRange(xval[0], xval[-1], padding=0)
-        self.graphWidget.setYRange(min(yval), max(yval), padding=0.1)
+        self.graphWidget.setXRange(self.xval.first(), self.xval.last(), padding=0)
+        self.graphWidget.setYRange(self.yval.min(), self.yval.max(), padding=0.1)
 
         # set the line color in 3-tuple of int values, line width in pixels, line style
         lvalue = pg.mkPen(color="#77ab56", width=1, style=QtCore.Qt.PenStyle.SolidLine)
 
         # plot data: x, y values with lines drawn using Qt's QPen types
         self.data_line = self.graphWidget.plot(xval, yval, pen=lvalue)
+        self.data_line.setPos(self.xval.origin, 0)
+
+        # the replayed session is played back from the first frame on
+        if self.source is not None:
+            self.source.start()
 
-        self.timer = QtCore.QTimer()
-        self.timer.setInterval(50)
-        self.timer.timeout.connect(self.update_data_line)
-        self.timer.start()
+        # title and y axis drawn from cached pixmaps, x scrolls every tick
+        cache_chrome(self.graphWidget, moving=("bottom",))
 
-    def update_data_line(self):
-        """Method uses QTimer to update the data every 50ms."""
+        # timings of the phases of every tick, off unless PYQTPLOT_PROBE is set
+        self.probe = window_probe(self.graphWidget, "pyqtplot12")
 
-        self.xval = self.xval[1:]
-        self.xval = np.append(self.xval, self.xval[-1] + self.step)
+        # frames of the shared scheduler, missed frames are merged
+        self.timer = shared_scheduler().add(self.update_data_line)
 
-        self.yval = self.yval[1:]
-        self.yval = np.append(self.yval, np.sin(self.xval[-1]))
+    def update_data_line(self, frames=1):
+        """Method uses the frame scheduler to update the data every 50ms,
+        frames is the number of frames due since the previous update."""
+        self.probe.begin(frames)
+
+        with self.probe.span("data"):
+            if self.source is not None:
+                # the samples of a replayed session
+                rows = self.source.read()
+                if not rows.size:
+                    return
+                xnew, ynew = rows["x"], rows["y"]
+            else:
+                xnew = self.xval.last() + self.step * np.arange(1, frames + 1)
+                ynew = np.sin(xnew)
+            self.xval.extend(xnew)
+            self.yval.extend(ynew)
+
+            if self.recorder is not None:
+                self.recorder.write(xnew, ynew)
+
+        xval, yval = self.xval.view(), self.yval.view()
 
         # set the axis limits within the specified ranges and padding
-        self.graphWidget.setXRange(self.xval[0], self.xval[-1], padding=0)
-        self.graphWidget.setYRange(min(self.yval), max(self.yval), padding=0.1)
+        with self.probe.span("range"):
+            self.graphWidget.setXRange(self.xval.first(), self.xval.last(), padding=0)
+            self.graphWidget.setYRange(self.yval.min(), self.yval.max(), padding=0.1)
+
+        # the curve is moved by the origin of the relative x values
+        with self.probe.span("setData"):
+            self.data_line.setPos(self.xval.origin, 0)
+            self.data_line.setData(xval, yval)
+
+    def closeEvent(self, event):
+        """Method stops the updates, the replay and the recorder on closing
+        the window."""
+        self.timer.stop()
+        if self.source is not None:
+            self.source.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        super().closeEvent(event)
+
+
+def create_window(record=None, replay=None, speed=1.0, seek=0.0):
+    """Create the main window with the data to plot, hidden by default.
+    The session is recorded to the file record, or the recorded session
+    replay is played back at speed times real time from seek seconds on."""
+
+    xval = np.linspace(-2 * np.pi, 2 * np.pi, 1000, retstep=True)
+
+    if replay is not None:
+        # the window starts with the samples recorded up to seek
+        source = ReplaySource(replay, speed, seek=seek)
+        history = source.history(len(xval[0]))
+        window = MainWindow(history["x"], history["y"], xval[1], source)
+        return window
+
+    recorder = None if record is None else Recorder(record, ("x", "y"))
+
+    # an instance of the class MainWindow
+    window = MainWindow(xval[0], np.sin(xval[0]), xval[1], recorder=recorder)
 
-        self.data_line.setData(self.xval, self.yval)
+    return window
 
 
 def main():
@@ -87,10 +164,7 @@ def main():
     If no command line arguments than QApplication([]) is required."""
     app = QtWidgets.QApplication(sys.argv)
 
-    xval = np.linspace(-2 * np.pi, 2 * np.pi, 1000, retstep=True)
-
-    # an instance of the class MainWindow
-    window = MainWindow(xval[0], np.sin(xval[0]), xval[1])
+    window = create_window()
     window.show()  # windows are hidden by default
 
     sys.exit(app.exec())  # start the event loop
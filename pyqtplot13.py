@@ -11,16 +11,31 @@ import numpy as np
 import pyqtgraph as pg
 from PyQt6 import QtCore, QtWidgets
 
+from chrome import cache_chrome
+from funcstream import HarmonicStream
+from precision import rebase_limit
+from probe import window_probe
+from scheduler import shared_scheduler
+from streambuffer import SlidingSeries
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """Subclass of QMainWindow to customize application's main window."""
 
     def __init__(self, xval, yval, step):
         super().__init__()
-        self.xval = xval
-        self.yval = yval
         self.step = step
 
+        # sliding window series with amortized O(1) append and y extrema,
+        # x is stored relative to an origin so it stays precise as it grows
+        self.xval = SlidingSeries(len(xval), rebase=rebase_limit())
+        self.yval = SlidingSeries(len(yval), extrema=True)
+        self.xval.extend(xval)
+        self.yval.extend(yval)
+
+        # incremental generator of the samples entering the window
+        self.wave = HarmonicStream(xval[-1], step)
+
         # set the size parameters (width, height) pixels
         self.setFixedSize(QtCore.QSize(640, 480))
 
@@ -45,37 +60,68 @@ class MainWindow(QtWidgets.QMainWindow):
         self.graphWidget.showGrid(x=True, y=True, alpha=0.5)
 
         # graphPlot method call
-        self.graphPlot(self.xval, self.yval)
+        self.graphPlot(self.xval.view(), self.yval.view())
 
     def graphPlot(self, xval, yval):
         """Method accepts x and y parameters to plot."""
 
         # set the axis limits within the specified ranges and padding
-        self.graphWidget.setXRange(xval[0], xval[-1], padding=0)
-        self.graphWidget.setYRange(min(yval), max(yval), padding=0.1)
+        self.graphWidget.setXRange(self.xval.first(), self.xval.last(), padding=0)
+        self.graphWidget.setYRange(self.yval.min(), self.yval.max(), padding=0.1)
 
         # set the line color in 3-tuple of int values, line width in pixels, line style
         lvalue = pg.mkPen(color="#77ab56", width=1, style=QtCore.Qt.PenStyle.SolidLine)
 
         # plot data: x, y values with lines drawn using Qt's QPen types
         self.data_line = self.graphWidget.plot(xval, yval, pen=lvalue)
+        self.data_line.setPos(self.xval.origin, 0)
+
+        # title and y axis drawn from cached pixmaps, x scrolls every tick
+        cache_chrome(self.graphWidget, moving=("bottom",))
+
+        # timings of the phases of every tick, off unless PYQTPLOT_PROBE is set
+        self.probe = window_probe(self.graphWidget, "pyqtplot13")
 
-        self.timer = QtCore.QTimer()
-        self.timer.setInterval(50)
-        self.timer.timeout.connect(self.update_data_line)
-        self.timer.start()
+        # frames of the shared scheduler, missed frames are merged
+        self.timer = shared_scheduler().add(self.update_data_line)
 
-    def update_data_line(self):
-        """Method uses QTimer to update the data every 50ms."""
+    def update_data_line(self, frames=1):
+        """Method uses the frame scheduler to update the data every 50ms,
+        frames is the number of frames due since the previous update."""
+        self.probe.begin(frames)
 
-        self.xval = np.linspace(self.xval[1], self.xval[-1] + self.step, 1000)
-        self.yval = np.sin(self.xval)
+        with self.probe.span("data"):
+            xnew, ynew = self.wave.take_sin(frames)
+            self.xval.extend(xnew)
+            self.yval.extend(ynew)
+
+        xval, yval = self.xval.view(), self.yval.view()
 
         # set the axis limits within the specified ranges and padding
-        self.graphWidget.setXRange(self.xval[0], self.xval[-1], padding=0)
-        self.graphWidget.setYRange(min(self.yval), max(self.yval), padding=0.1)
+        with self.probe.span("range"):
+            self.graphWidget.setXRange(self.xval.first(), self.xval.last(), padding=0)
+            self.graphWidget.setYRange(self.yval.min(), self.yval.max(), padding=0.1)
+
+        # the curve is moved by the origin of the relative x values
+        with self.probe.span("setData"):
+            self.data_line.setPos(self.xval.origin, 0)
+            self.data_line.setData(xval, yval)
+
+    def closeEvent(self, event):
+        """Method detaches the window from the frame scheduler on closing it."""
+        self.timer.stop()
+        super().closeEvent(event)
 
-        self.data_line.setData(self.xval, self.yval)
+
+def create_window():
+    """Create the main window with the data to plot, hidden by default."""
+
+    xval = np.linspace(-2 * np.pi, 2 * np.pi, 1000, retstep=True)
+
+    # an instance of the class MainWindow
+    window = MainWindow(xval[0], np.sin(xval[0]), xval[1])
+
+    return window
 
 
 def main():
@@ -84,10 +130,7 @@ def main():
     If no command line arguments than QApplication([]) is required."""
     app = QtWidgets.QApplication(sys.argv)
 
-    xval = np.linspace(-2 * np.pi, 2 * np.pi, 1000, retstep=True)
-
-    # an instance of the class MainWindow
-    window = MainWindow(xval[0], np.sin(xval[0]), xval[1])
+    window = create_window()
     window.show()  # windows are hidden by default
 
     sys.exit(app.exec())  # start the event loop
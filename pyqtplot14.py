@@ -11,6 +11,13 @@ import numpy as np
 import pyqtgraph as pg
 from PyQt6 import QtCore, QtWidgets
 
+from chrome import cache_chrome
+from precision import float_dtype
+from probe import window_probe
+from progressive import ProgressiveCurve
+from quality import QualityController
+from scheduler import shared_scheduler
+
 pg.setConfigOptions(antialias=True)
 
 
@@ -19,8 +26,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def __init__(self, xval, yval):
         super().__init__()
-        self.xval = xval
-        self.yval = yval
+        self.xval = np.asarray(xval, dtype=float_dtype())
+        self.yval = np.asarray(yval, dtype=float_dtype())
         self.nval = 0
 
         # set the size parameters (width, height) pixels
@@ -54,19 +61,54 @@ class MainWindow(QtWidgets.QMainWindow):
         lvalue = pg.mkPen(color="#77ab56", width=1, style=QtCore.Qt.PenStyle.SolidLine)
 
         # plot data: x, y values with lines drawn using Qt's QPen types
-        self.data_line = self.graphWidget.plot(
-            self.xval[0:1], self.yval[0:1], pen=lvalue
+        # on an append-only curve that only processes the revealed tail
+        self.data_line = ProgressiveCurve(self.graphWidget, pen=lvalue)
+        self.data_line.setData(self.xval[0:1], self.yval[0:1])
+
+        # title, axes and grid drawn from cached pixmaps
+        cache_chrome(self.graphWidget)
+
+        # timings of the phases of every tick, off unless PYQTPLOT_PROBE is set
+        self.probe = window_probe(self.graphWidget, "pyqtplot14")
+
+        # frames of the shared scheduler, missed frames are merged
+        self.timer = shared_scheduler().add(self.update_data_line)
+
+        # aliased, thinner and decimated curves while the animation is busy
+        self.quality = QualityController(
+            self.graphWidget,
+            thresholds=(20_000, 200_000),
+            client=self.timer,
         )
 
-        self.timer = QtCore.QTimer()
-        self.timer.setInterval(50)
-        self.timer.timeout.connect(self.update_data_line)
-        self.timer.start()
+    def update_data_line(self, frames=1):
+        """Method uses the frame scheduler to update the data every 50ms,
+        frames is the number of frames due since the previous update."""
+        self.probe.begin(frames)
+        self.nval = self.nval + frames
+        with self.probe.span("setData"):
+            self.data_line.setData(self.xval[0 : self.nval], self.yval[0 : self.nval])
+
+        # full quality again once the animation is done
+        if self.nval < len(self.xval):
+            self.quality.update(self.nval, frames)
+        else:
+            self.quality.finish()
+
+    def closeEvent(self, event):
+        """Method detaches the window from the frame scheduler on closing it."""
+        self.timer.stop()
+        super().closeEvent(event)
+
 
-    def update_data_line(self):
-        """Method uses QTimer to update the data every 50ms."""
-        self.nval = self.nval + 1
-        self.data_line.setData(self.xval[0 : self.nval], self.yval[0 : self.nval])
+def create_window():
+    """Create the main window with the data to plot, hidden by default."""
+
+    xval = np.linspace(-2 * np.pi, 2 * np.pi, 1000, retstep=False)
+
+    window = MainWindow(xval, np.sin(xval))  # an instance of the class MainWindow
+
+    return window
 
 
 def main():
@@ -75,9 +117,7 @@ def main():
     If no command line arguments than QApplication([]) is required."""
     app = QtWidgets.QApplication(sys.argv)
 
-    xval = np.linspace(-2 * np.pi, 2 * np.pi, 1000, retstep=False)
-
-    window = MainWindow(xval, np.sin(xval))  # an instance of the class MainWindow
+    window = create_window()
     window.show()  # windows are hidden by default
 
     sys.exit(app.exec())  # start the event loop
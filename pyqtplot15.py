@@ -11,6 +11,13 @@ import numpy as np
 import pyqtgraph as pg
 from PyQt6 import QtCore, QtWidgets
 
+from channels import ChannelFrame
+from chrome import cache_chrome
+from probe import window_probe
+from progressive import ProgressiveCurve
+from quality import QualityController
+from scheduler import shared_scheduler
+
 pg.setConfigOptions(antialias=True)
 
 
@@ -19,11 +26,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def __init__(self, xval, wav1, wav2):
         super().__init__()
-        self.xval = xval
-        self.wav1 = wav1
-        self.wav2 = wav2
         self.nval = 0
 
+        # one x buffer and both waves as channels, the first sample shown
+        self.frame = ChannelFrame(xval, (wav1, wav2), ("sin(x)", "cos(x)"), count=1)
+
         # set the size parameters (width, height) pixels
         self.setFixedSize(QtCore.QSize(640, 480))
 
@@ -51,7 +58,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.graphWidget.showGrid(x=True, y=True, alpha=0.5)
 
         # graphPlot method call
-        self.graphPlot(self.xval, self.wav1, self.wav2)
+        self.graphPlot(xval, wav1, wav2)
 
     def graphPlot(self, xval, wav1, wav2):
         """Method accepts x and y parameters to plot."""
@@ -61,23 +68,60 @@ class MainWindow(QtWidgets.QMainWindow):
         self.graphWidget.setYRange(min(wav1), max(wav1), padding=0.1)
 
         # plot data: x, y values with lines drawn using Qt's QPen types
-        self.data_line1 = self.graphWidget.plot(
-            xval[0:1], wav1[0:1], name="sin(x)", pen=pg.mkPen(color="#fa8775")
+        self.data_line1 = ProgressiveCurve(
+            self.graphWidget, name="sin(x)", pen=pg.mkPen(color="#fa8775")
+        )
+        self.frame.bind(self.data_line1, "sin(x)")
+        self.data_line2 = ProgressiveCurve(
+            self.graphWidget, name="cos(x)", pen=pg.mkPen(color="#3574e2")
         )
-        self.data_line2 = self.graphWidget.plot(
-            xval[0:1], wav2[0:1], name="cos(x)", pen=pg.mkPen(color="#3574e2")
+        self.frame.bind(self.data_line2, "cos(x)")
+
+        # title, axes, grid and legend drawn from cached pixmaps
+        cache_chrome(self.graphWidget)
+
+        # timings of the phases of every tick, off unless PYQTPLOT_PROBE is set
+        self.probe = window_probe(self.graphWidget, "pyqtplot15")
+
+        # frames of the shared scheduler, missed frames are merged
+        self.timer = shared_scheduler().add(self.update_data_line)
+
+        # aliased, thinner and decimated curves while the animation is busy
+        self.quality = QualityController(
+            self.graphWidget,
+            thresholds=(20_000, 200_000),
+            client=self.timer,
         )
 
-        self.timer = QtCore.QTimer()
-        self.timer.setInterval(50)
-        self.timer.timeout.connect(self.update_data_line)
-        self.timer.start()
+    def update_data_line(self, frames=1):
+        """Method uses the frame scheduler to update the data every 50ms,
+        frames is the number of frames due since the previous update."""
+        self.probe.begin(frames)
+        self.nval = self.nval + frames
+        with self.probe.span("setData"):
+            self.frame.reveal(self.nval)
+
+        # full quality again once the animation is done
+        if self.nval < len(self.frame):
+            self.quality.update(2 * self.nval, frames)
+        else:
+            self.quality.finish()
+
+    def closeEvent(self, event):
+        """Method detaches the window from the frame scheduler on closing it."""
+        self.timer.stop()
+        super().closeEvent(event)
+
 
-    def update_data_line(self):
-        """Method uses QTimer to update the data every 50ms."""
-        self.nval = self.nval + 1
-        self.data_line1.setData(self.xval[0 : self.nval], self.wav1[0 : self.nval])
-        self.data_line2.setData(self.xval[0 : self.nval], self.wav2[0 : self.nval])
+def create_window():
+    """Create the main window with the data to plot, hidden by default."""
+
+    xval = np.linspace(-2 * np.pi, 2 * np.pi, 1000, retstep=False)
+
+    # an instance of the class MainWindow
+    window = MainWindow(xval, np.sin(xval), np.cos(xval))
+
+    return window
 
 
 def main():
@@ -86,10 +130,7 @@ def main():
     If no command line arguments than QApplication([]) is required."""
     app = QtWidgets.QApplication(sys.argv)
 
-    xval = np.linspace(-2 * np.pi, 2 * np.pi, 1000, retstep=False)
-
-    # an instance of the class MainWindow
-    window = MainWindow(xval, np.sin(xval), np.cos(xval))
+    window = create_window()
     window.show()  # windows are hidden by default
 
     sys.exit(app.exec())  # start the event loop
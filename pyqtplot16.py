@@ -11,6 +11,9 @@ import numpy as np
 import pyqtgraph as pg
 from PyQt6 import QtCore, QtWidgets
 
+from channels import ChannelFrame
+from decimate import DecimatedCurve
+
 pg.setConfigOptions(antialias=True)
 
 
@@ -19,9 +22,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def __init__(self, xval, wav1, wav2):
         super().__init__()
-        self.xval = xval
-        self.wav1 = wav1
-        self.wav2 = wav2
+
+        # one x buffer and both waves as channels
+        self.frame = ChannelFrame(xval, (wav1, wav2), ("sin(x)", "cos(x)"))
 
         # set the size parameters (width, height) pixels
         self.setFixedSize(QtCore.QSize(640, 480))
@@ -53,7 +56,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.graphLine2.showGrid(x=True, y=True, alpha=0.5)
 
         # graphPlot method call
-        self.graphPlot(self.xval, self.wav1, self.wav2)
+        self.graphPlot(xval, wav1, wav2)
 
     def graphPlot(self, xval, wav1, wav2):
         """Method accepts x and y parameters to plot."""
@@ -62,17 +65,32 @@ class MainWindow(QtWidgets.QMainWindow):
         self.graphLine1.setXRange(xval[0], xval[-1], padding=0)
         self.graphLine1.setYRange(min(wav1), max(wav1), padding=0.1)
 
-        self.data_line1 = self.graphLine1.plot(
-            xval, wav1, name="sin(x)", pen=pg.mkPen(color="#fa8775")
+        # min/max decimated to the pixel columns of the view
+        self.data_line1 = DecimatedCurve(
+            self.graphLine1, name="sin(x)", pen=pg.mkPen(color="#fa8775")
         )
+        self.frame.bind(self.data_line1, "sin(x)")
 
         # set the axis limits within the specified ranges and padding
         self.graphLine2.setXRange(xval[0], xval[-1], padding=0)
         self.graphLine2.setYRange(min(wav2), max(wav2), padding=0.1)
 
-        self.data_line2 = self.graphLine2.plot(
-            xval, wav2, name="cos(x)", pen=pg.mkPen(color="#3574e2")
+        # min/max decimated to the pixel columns of the view
+        self.data_line2 = DecimatedCurve(
+            self.graphLine2, name="cos(x)", pen=pg.mkPen(color="#3574e2")
         )
+        self.frame.bind(self.data_line2, "cos(x)")
+
+
+def create_window():
+    """Create the main window with the data to plot, hidden by default."""
+
+    xval = np.linspace(-2 * np.pi, 2 * np.pi, 1000, retstep=False)
+
+    # an instance of the class MainWindow
+    window = MainWindow(xval, np.sin(xval), np.cos(xval))
+
+    return window
 
 
 def main():
@@ -81,10 +99,7 @@ def main():
     If no command line arguments than QApplication([]) is required."""
     app = QtWidgets.QApplication(sys.argv)
 
-    xval = np.linspace(-2 * np.pi, 2 * np.pi, 1000, retstep=False)
-
-    # an instance of the class MainWindow
-    window = MainWindow(xval, np.sin(xval), np.cos(xval))
+    window = create_window()
     window.show()  # windows are hidden by default
 
     sys.exit(app.exec())  # start the event loop
@@ -5,23 +5,33 @@
 
 """ Script to create plot using the PlotWidget in PyQtGraph """
 
+import argparse
 import sys
 
 import numpy as np
 import pyqtgraph as pg
 from PyQt6 import QtCore, QtWidgets
 
+from chrome import cache_chrome
+from lorenz import BETA, RHO, SIGMA, LorenzStream
+from multipanel import BatchUpdate
+from probe import window_probe
+from progressive import ProgressiveCurve
+from quality import QualityController
+from scheduler import shared_scheduler
+from trail import TrailCurve
+
 pg.setConfigOptions(antialias=True)
 
 
 class MainWindow(QtWidgets.QMainWindow):
     """Subclass of QMainWindow to customize qpplication's main window."""
 
-    def __init__(self, xval, yval, zval):
+    def __init__(self, stream, trail=None, fade=False):
         super().__init__()
-        self.xval = xval
-        self.yval = yval
-        self.zval = zval
+        self.stream = stream
+        self.trail = trail
+        self.fade = fade
         self.n = 0
 
         # set the size parameters (width, height) pixels
@@ -37,6 +47,9 @@ class MainWindow(QtWidgets.QMainWindow):
         # set the title of plot window
         self.graphWidget.setWindowTitle("Lorenz attractor")
 
+        # curve and range changes of all panels applied in one update
+        self.batch = BatchUpdate(self.graphWidget)
+
         # widget for generating multi-panel figures
         self.graphLine1 = self.graphWidget.addPlot(row=0, col=0)
         self.graphLine2 = self.graphWidget.addPlot(row=0, col=1)
@@ -47,54 +60,140 @@ class MainWindow(QtWidgets.QMainWindow):
             graphLine.hideAxis("left")
             graphLine.hideAxis("bottom")
 
-        # graphPlot method call
-        self.graphPlot(self.xval, self.yval, self.zval)
+        # graphPlot method call, trails start past the initial condition
+        self.graphPlot(*(self.stream.take(1) if trail else self.stream.view(1)))
 
     def graphPlot(self, xval, yval, zval):
         """Method accepts x and y parameters to plot."""
 
-        self.data_line1 = self.graphLine1.plot(
-            x=xval[0:1], y=zval[0:1], pen=pg.mkPen(color="#dcdcdc")
-        )
-        self.data_line2 = self.graphLine2.plot(
-            x=yval[0:1], y=zval[0:1], pen=pg.mkPen(color="#dcdcdc")
-        )
-        self.data_line3 = self.graphLine3.plot(
-            x=yval[0:1], y=xval[0:1], pen=pg.mkPen(color="#dcdcdc")
+        if self.trail:
+            # the last trail points of every panel, faded by age with fade
+            self.data_line1 = TrailCurve(
+                self.graphLine1, self.trail, self.fade, pen=pg.mkPen(color="#dcdcdc")
+            )
+            self.data_line2 = TrailCurve(
+                self.graphLine2, self.trail, self.fade, pen=pg.mkPen(color="#dcdcdc")
+            )
+            self.data_line3 = TrailCurve(
+                self.graphLine3, self.trail, self.fade, pen=pg.mkPen(color="#dcdcdc")
+            )
+
+            self.data_line1.extend(xval[0:1], zval[0:1])
+            self.data_line2.extend(yval[0:1], zval[0:1])
+            self.data_line3.extend(yval[0:1], xval[0:1])
+        else:
+            # append-only curves that only process the revealed tail
+            self.data_line1 = ProgressiveCurve(
+                self.graphLine1, pen=pg.mkPen(color="#dcdcdc")
+            )
+            self.data_line2 = ProgressiveCurve(
+                self.graphLine2, pen=pg.mkPen(color="#dcdcdc")
+            )
+            self.data_line3 = ProgressiveCurve(
+                self.graphLine3, pen=pg.mkPen(color="#dcdcdc")
+            )
+
+            self.data_line1.setData(xval[0:1], zval[0:1])
+            self.data_line2.setData(yval[0:1], zval[0:1])
+            self.data_line3.setData(yval[0:1], xval[0:1])
+
+        # titles drawn from cached pixmaps, the axes autorange every tick
+        cache_chrome(self.graphWidget, moving=("left", "bottom"))
+
+        # timings of the phases of every tick, off unless PYQTPLOT_PROBE is set
+        self.probe = window_probe(self.graphWidget, "pyqtplot18")
+
+        # frames of the shared scheduler, missed frames are merged
+        self.timer = shared_scheduler().add(self.update_data_line)
+
+        # aliased, thinner and subsampled curves while the animation is busy
+        self.quality = QualityController(
+            self.graphWidget,
+            thresholds=(10_000, 100_000),
+            method="subsample",
+            client=self.timer,
         )
 
-        self.timer = QtCore.QTimer()
-        self.timer.setInterval(50)
-        self.timer.timeout.connect(self.update_data_line)
-        self.timer.start()
+    def update_data_line(self, frames=1):
+        """Method uses the frame scheduler to update the data every 50ms,
+        frames is the number of frames due since the previous update."""
+        self.probe.begin(frames)
+        if self.trail:
+            self.update_trail(frames)
+            return
 
-    def update_data_line(self):
-        """Method uses QTimer to update the data every 50ms."""
-        self.n = self.n + 1
-        self.data_line1.setData(self.xval[0 : self.n], self.zval[0 : self.n])
-        self.data_line2.setData(self.yval[0 : self.n], self.zval[0 : self.n])
-        self.data_line3.setData(self.yval[0 : self.n], self.xval[0 : self.n])
+        self.n = min(self.n + frames, self.stream.nstep)
 
+        # integrate ahead only as far as the revealed points need
+        with self.probe.span("data"):
+            xval, yval, zval = self.stream.view(self.n)
 
-def main():
-    """Need one (and only one) QApplication instance per application.
-    Pass in sys.argv to allow command line arguments for the application.
-    If no command line arguments than QApplication([]) is required."""
-    app = QtWidgets.QApplication(sys.argv)
+        with self.probe.span("setData"), self.batch:
+            self.batch.setData(self.data_line1, xval, zval)
+            self.batch.setData(self.data_line2, yval, zval)
+            self.batch.setData(self.data_line3, yval, xval)
+
+        # full quality again once the animation is done
+        if self.n < self.stream.nstep:
+            self.quality.update(3 * self.n, frames)
+        else:
+            self.quality.finish()
+
+    def update_trail(self, frames):
+        """Method appends the next points of the trajectory to the trails,
+        each frame draws a fixed number of points however long it runs."""
+        self.n = self.n + frames
+
+        # integrated past nstep, only the trails keep the points
+        with self.probe.span("data"):
+            xval, yval, zval = self.stream.take(frames)
+
+        with self.probe.span("setData"):
+            self.data_line1.extend(xval, zval)
+            self.data_line2.extend(yval, zval)
+            self.data_line3.extend(yval, xval)
+
+        self.quality.update(3 * len(self.data_line1), frames)
+
+    def closeEvent(self, event):
+        """Method detaches the window from the frame scheduler on closing it."""
+        self.timer.stop()
+        super().closeEvent(event)
+
+
+def create_window(trail=None, fade=True):
+    """Create the main window with the data to plot, hidden by default.
+    With trail only the last trail points of every panel are drawn, faded
+    by age with fade, and the attractor is animated indefinitely."""
 
     N = 5000
     DELT = 0.01
-    SIGMA, BETA, RHO = 10.0, 8.0 / 3.0, 28.0
-
-    xval, yval, zval = [np.ones(N) for _ in range(3)]
 
-    for n in range(N - 1):
-        xval[n + 1] = DELT * (SIGMA * (yval[n] - xval[n])) + xval[n]
-        yval[n + 1] = DELT * (xval[n] * (RHO - zval[n]) - yval[n]) + yval[n]
-        zval[n + 1] = DELT * (xval[n] * yval[n] - BETA * zval[n]) + zval[n]
+    # forward Euler trajectory from (1, 1, 1) integrated lazily in chunks
+    stream = LorenzStream(np.ones(3), N, DELT, sigma=SIGMA, rho=RHO, beta=BETA)
 
     # an instance of the class MainWindow
-    window = MainWindow(xval, yval, zval)
+    window = MainWindow(stream, trail, fade)
+
+    return window
+
+
+def main():
+    """Need one (and only one) QApplication instance per application.
+    Pass in sys.argv to allow command line arguments for the application.
+    If no command line arguments than QApplication([]) is required."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--trail", type=int, help="animate indefinitely, drawing the last TRAIL points"
+    )
+    parser.add_argument(
+        "--no-fade", dest="fade", action="store_false", help="trail of one color"
+    )
+    args, qtargs = parser.parse_known_args()
+
+    app = QtWidgets.QApplication(sys.argv[:1] + qtargs)
+
+    window = create_window(args.trail, args.fade)
     window.show()  # windows are hidden by default
 
     sys.exit(app.exec())  # start the event loop
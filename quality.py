@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# File: quality.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module to lower the rendering quality of the animated plots under load """
+
+import pyqtgraph as pg
+from PyQt6 import QtCore
+
+from chrome import plot_items
+
+# rendering of the curves from full quality down, levels are cumulative
+LEVELS = (
+    {"antialias": True, "thin": False, "downsample": 1},
+    {"antialias": False, "thin": False, "downsample": 1},
+    {"antialias": False, "thin": True, "downsample": 4},
+)
+
+
+class QualityController:
+    """Rendering quality of the curves of a view, lowered while it is busy.
+
+    The window calls update() on every tick with the points drawn and the
+    frames the scheduler merged into the tick. A tick that merges frames
+    ran over the frame budget and lowers the quality by one level, and the
+    number of `thresholds` the points exceed is a level of its own: level 1
+    draws aliased strokes, level 2 also draws zero-width (one pixel) pens
+    and keeps the min and max of every 4 points (peak downsampling), or
+    every 4th point with method="subsample" for curves whose x is not
+    sorted, like parametric curves, which peak downsampling distorts.
+
+    The level of the late ticks only decays by one after `recover` ticks
+    in a row were on budget, so a load just under the budget does not
+    toggle the quality, and restyle every curve, on alternate ticks.
+
+    Full quality is restored by finish(), once the animation is done, or
+    once the view is idle: with the FrameClient of the window as client,
+    when the client was stopped, since slow ticks back to back can leave
+    more than `idle` milliseconds between two updates; without one, when
+    update() is not called for `idle` milliseconds. Curves added later,
+    like the items frozen by ProgressiveCurve, get the current level on
+    the next update."""
+
+    def __init__(
+        self,
+        view,
+        thresholds=(10_000, 100_000),
+        idle=500,
+        method="peak",
+        recover=20,
+        client=None,
+    ):
+        self.view = view
+        self.thresholds = thresholds
+        self.method = method
+        self.recover = recover
+        self.client = client  # FrameClient driving the updates, if any
+        self.level = 0
+        self._late = 0  # level reached by ticks over the frame budget
+        self._ontime = 0  # ticks on budget since the last late one
+        self._styled = {}  # item: full quality pen of the items seen
+
+        self._idle = QtCore.QTimer()
+        self._idle.setSingleShot(True)
+        self._idle.setInterval(idle)
+        self._idle.timeout.connect(self._expired)
+
+    def update(self, points, frames=1):
+        """Adapt the quality to a tick drawing points after frames were due."""
+        if frames > 1:
+            self._late = min(self._late + 1, len(LEVELS) - 1)
+            self._ontime = 0
+        elif self._late:
+            self._ontime += 1
+            if self._ontime >= self.recover:
+                self._late -= 1
+                self._ontime = 0
+        level = max(self._late, sum(points > limit for limit in self.thresholds))
+        self._idle.start()
+        self.setLevel(level)
+
+    def _expired(self):
+        """Restore full quality unless the client is still scheduled."""
+        if self.client is not None and self.client.isActive():
+            self._idle.start()
+        else:
+            self.finish()
+
+    def finish(self):
+        """Restore full quality, the animation is idle or done."""
+        self._idle.stop()
+        self._late = 0
+        self._ontime = 0
+        self.setLevel(0)
+
+    def setLevel(self, level):
+        """Render the curves of the view at a quality level."""
+        items = [
+            item for plot in plot_items(self.view) for item in plot.listDataItems()
+        ]
+        # forget the items removed from the view, like those ProgressiveCurve
+        # merges or clears, so their data is not kept alive
+        self._styled = {
+            item: self._styled[item] for item in items if item in self._styled
+        }
+        if level == self.level:
+            # only the items added since the last call
+            items = [item for item in items if item not in self._styled]
+            if not level:
+                # drawn at full quality already, only their pen is kept
+                self._styled.update((item, item.opts["pen"]) for item in items)
+                return
+        self.level = level
+        for item in items:
+            self._apply(item, LEVELS[level])
+
+    def _apply(self, item, options):
+        """Render one PlotDataItem with the options of a level."""
+        pen = self._styled.setdefault(item, item.opts["pen"])
+        item.opts["antialias"] = options["antialias"]
+        item.curve.opts["antialias"] = options["antialias"]
+        if options["thin"]:
+            thin = pg.mkPen(pen)
+            thin.setWidth(0)
+            item.setPen(thin)
+        else:
+            item.setPen(pen)
+        # a fixed factor, auto downsampling redoes every item on each range change
+        item.setDownsampling(ds=options["downsample"], auto=False, method=self.method)
+        item.curve.update()
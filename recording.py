@@ -0,0 +1,361 @@
+#!/usr/bin/env python
+# File: recording.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Script to record the live plot sessions and to replay them at any speed """
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from datasource import DataSource
+
+MAGIC = b"PQREC\x00\x01\x00"
+
+# header of every chunk in the recording, the rows follow column by column
+CHUNK = np.dtype([("count", "<u8"), ("t0", "<f8"), ("t1", "<f8")])
+
+# entry of the sidecar index, one per chunk
+INDEX = np.dtype(
+    [
+        ("offset", "<u8"),
+        ("row", "<u8"),
+        ("count", "<u8"),
+        ("t0", "<f8"),
+        ("t1", "<f8"),
+    ]
+)
+
+
+class Recorder:
+    """Append-only writer of rows of timestamped columns.
+
+    Rows are buffered in memory and written one chunk at a time, the
+    columns of a chunk stored one after the other after a CHUNK header
+    with the row count and the first and last timestamp. Every chunk also
+    appends an INDEX entry to the sidecar file path + ".idx". The time
+    column holds the seconds since the first write, all the rows of one
+    write share the same timestamp, so a write is a tick.
+
+    A chunk is also written once its first row is `interval` seconds old,
+    so a slow source loses at most that much of the session if the process
+    dies, instead of the rows of a whole chunk."""
+
+    def __init__(self, path, columns, chunk=4096, interval=1.0):
+        self.path = os.fspath(path)
+        self.dtype = np.dtype([("time", "<f8")] + [(name, "<f8") for name in columns])
+        self.interval = interval
+        self.rows = 0
+        self._buffer = np.empty(chunk, dtype=self.dtype)
+        self._count = 0
+        self._origin = None
+
+        header = json.dumps({"columns": self.dtype.descr}).encode()
+        self._file = open(self.path, "wb")
+        self._file.write(MAGIC + np.uint32(len(header)).tobytes() + header)
+        self._index = open(self.path + ".idx", "wb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def write(self, *columns):
+        """Append the rows of the columns, stamped with the current time."""
+        now = time.perf_counter()
+        if self._origin is None:
+            self._origin = now
+        stamp = now - self._origin
+        size = len(columns[0])
+        start = 0
+        while start < size:
+            count = min(size - start, len(self._buffer) - self._count)
+            rows = self._buffer[self._count : self._count + count]
+            rows["time"] = stamp
+            for name, values in zip(self.dtype.names[1:], columns):
+                rows[name] = np.asarray(values)[start : start + count]
+            self._count += count
+            start += count
+            if self._count == len(self._buffer):
+                self.flush()
+        if self._count and stamp - self._buffer["time"][0] >= self.interval:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows as one chunk."""
+        if not self._count:
+            return
+        rows = self._buffer[: self._count]
+        entry = np.array(
+            [
+                (
+                    self._file.tell(),
+                    self.rows,
+                    self._count,
+                    rows["time"][0],
+                    rows["time"][-1],
+                )
+            ],
+            dtype=INDEX,
+        )
+        header = np.array(
+            [(self._count, rows["time"][0], rows["time"][-1])], dtype=CHUNK
+        )
+        self._file.write(header.tobytes())
+        for name in self.dtype.names:
+            self._file.write(np.ascontiguousarray(rows[name]).tobytes())
+        self._file.flush()
+        self._index.write(entry.tobytes())
+        self._index.flush()
+        self.rows += self._count
+        self._count = 0
+
+    def close(self):
+        """Write the last rows and close the files."""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+        self._index.close()
+
+
+class Recording:
+    """Reader of a file written by a Recorder.
+
+    The sidecar index is loaded at open, chunks missing from it (a
+    recording interrupted before the index was written) are found by
+    walking the chunk headers. seek() is a binary search over the index and
+    then over the timestamps of one chunk, so it is O(log n) in the rows."""
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a recording")
+            size = int(np.frombuffer(file.read(4), dtype="<u4")[0])
+            header = json.loads(file.read(size))
+            self._start = file.tell()
+        self.dtype = np.dtype([tuple(column) for column in header["columns"]])
+        self.index = self._load_index()
+        self._cached = (None, None)
+
+    def _load_index(self):
+        """Return the index of every complete chunk of the recording."""
+        index = np.empty(0, dtype=INDEX)
+        if os.path.exists(self.path + ".idx"):
+            index = np.fromfile(self.path + ".idx", dtype=INDEX)
+        entries = [index]
+        if len(index):
+            offset = int(index["offset"][-1]) + self._chunk_size(index["count"][-1])
+            row = int(index["row"][-1] + index["count"][-1])
+        else:
+            offset, row = self._start, 0
+
+        # walk the headers of the chunks written after the last index entry
+        size = os.path.getsize(self.path)
+        with open(self.path, "rb") as file:
+            while offset + CHUNK.itemsize <= size:
+                file.seek(offset)
+                header = np.frombuffer(file.read(CHUNK.itemsize), dtype=CHUNK)[0]
+                if offset + self._chunk_size(header["count"]) > size:
+                    break  # a chunk still being written
+                entries.append(
+                    np.array(
+                        [(offset, row, header["count"], header["t0"], header["t1"])],
+                        dtype=INDEX,
+                    )
+                )
+                offset += self._chunk_size(header["count"])
+                row += int(header["count"])
+        return np.concatenate(entries)
+
+    def _chunk_size(self, count):
+        return CHUNK.itemsize + int(count) * self.dtype.itemsize
+
+    def __len__(self):
+        if not len(self.index):
+            return 0
+        return int(self.index["row"][-1] + self.index["count"][-1])
+
+    def chunk(self, number):
+        """Return the rows of one chunk as a structured array."""
+        if self._cached[0] == number:
+            return self._cached[1]
+        entry = self.index[number]
+        count = int(entry["count"])
+        rows = np.empty(count, dtype=self.dtype)
+        with open(self.path, "rb") as file:
+            file.seek(int(entry["offset"]) + CHUNK.itemsize)
+            for name in self.dtype.names:
+                rows[name] = np.fromfile(file, dtype=self.dtype[name], count=count)
+        self._cached = (number, rows)
+        return rows
+
+    def read(self, start, stop):
+        """Return the rows [start, stop) as a structured array."""
+        stop = min(stop, len(self))
+        if start >= stop:
+            return np.empty(0, dtype=self.dtype)
+        first = int(np.searchsorted(self.index["row"], start, side="right")) - 1
+        last = int(np.searchsorted(self.index["row"], stop, side="left"))
+        parts = []
+        for number in range(first, last):
+            base = int(self.index["row"][number])
+            rows = self.chunk(number)
+            parts.append(rows[max(start - base, 0) : stop - base])
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def seek(self, stamp, side="left"):
+        """Return the first row stamped at or (side="right") after stamp."""
+        number = int(np.searchsorted(self.index["t1"], stamp, side=side))
+        if number == len(self.index):
+            return len(self)
+        times = self.chunk(number)["time"]
+        return int(self.index["row"][number]) + int(
+            np.searchsorted(times, stamp, side=side)
+        )
+
+    def stamp(self, row):
+        """Return the timestamp of a row."""
+        return float(self.read(row, row + 1)["time"][0])
+
+
+class ReplaySource(DataSource):
+    """Source playing back a recording at speed times real time.
+
+    The playback starts after the rows stamped up to `seek` seconds, which
+    history() returns to fill the window. With speed 0 every read returns
+    the next tick of the recording regardless of the clock, as fast as the
+    frames are run, which makes rendering benchmarks deterministic. With a
+    field, read() returns that column only, like the live sources."""
+
+    def __init__(self, path, speed=1.0, field=None, seek=0.0):
+        self.recording = Recording(path)
+        self.speed = speed
+        self.field = field
+        self._clock = None
+        self.seek(seek)
+
+    @property
+    def finished(self):
+        """Whether every row was played back."""
+        return self._row >= len(self.recording)
+
+    def seek(self, stamp):
+        """Continue the playback after the rows stamped up to stamp."""
+        self._row = self.recording.seek(stamp, side="right")
+        self._stamp = stamp
+        if self._clock is not None:
+            self._clock = time.perf_counter()
+
+    def history(self, count):
+        """Return the last count rows played back, at least one.
+
+        The windows continue their data from the last sample, so when no
+        row was played back yet, e.g. seek is before the first row, the
+        first tick of the recording is played back now."""
+        if not self._row:
+            if not len(self.recording):
+                raise ValueError(f"{self.recording.path} has no rows to replay")
+            stamp = self.recording.stamp(0)
+            self._row = self.recording.seek(stamp, side="right")
+            self._stamp = max(self._stamp, stamp)
+        return self.recording.read(max(self._row - count, 0), self._row)
+
+    def start(self):
+        self._clock = time.perf_counter()
+
+    def stop(self):
+        if self._clock is not None:
+            self._stamp += (time.perf_counter() - self._clock) * self.speed
+        self._clock = None
+
+    def read(self):
+        if self.finished:
+            rows = self.recording.read(0, 0)
+        elif self.speed:
+            elapsed = 0 if self._clock is None else time.perf_counter() - self._clock
+            stop = self.recording.seek(self._stamp + elapsed * self.speed, side="right")
+            rows = self.recording.read(self._row, stop)
+            self._row = stop
+        else:
+            stamp = self.recording.stamp(self._row)
+            stop = self.recording.seek(stamp, side="right")
+            rows = self.recording.read(self._row, stop)
+            self._row = stop
+        return rows[self.field] if self.field else rows
+
+
+def info(args):
+    """Print the size and the time span of a recording."""
+    recording = Recording(args.file)
+    index = recording.index
+    print(f"columns: {', '.join(recording.dtype.names)}")
+    print(f"rows: {len(recording)} in {len(index)} chunks")
+    if len(index):
+        print(f"time: {index['t0'][0]:.3f}s to {index['t1'][-1]:.3f}s")
+
+
+def session(args):
+    """Record a session of a script or replay one into its window."""
+    from PyQt6 import QtCore, QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv)
+    module = importlib.import_module(args.script)
+    if args.command == "record":
+        window = module.create_window(record=args.file)
+    else:
+        # the benchmark replays the ticks as fast as possible
+        speed = 0 if args.bench else args.speed
+        window = module.create_window(replay=args.file, speed=speed, seek=args.seek)
+    window.show()
+
+    if args.command == "replay" and args.bench:
+        # the ticks of the recording one after the other, without the timer
+        window.timer.stop()
+        ticks = 0
+        start = time.perf_counter()
+        while not window.source.finished:
+            window.update_data_line()
+            app.processEvents()
+            ticks += 1
+        elapsed = time.perf_counter() - start
+        print(f"{ticks} ticks in {elapsed:.3f}s, {1000 * elapsed / ticks:.3f}ms/tick")
+        window.close()
+        return
+
+    if args.duration:
+        QtCore.QTimer.singleShot(int(1000 * args.duration), app.quit)
+    status = app.exec()
+    window.close()  # the window closes its recorder
+    sys.exit(status)
+
+
+def main():
+    """Record or replay a session of pyqtplot11 or pyqtplot12."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=("record", "replay", "info"))
+    parser.add_argument("file", help="recording file")
+    parser.add_argument("--script", default="pyqtplot11", help="pyqtplot11 or 12")
+    parser.add_argument("--speed", type=float, default=1, help="0 as fast as possible")
+    parser.add_argument("--seek", type=float, default=0, help="seconds to start at")
+    parser.add_argument("--duration", type=float, default=0, help="seconds to run")
+    parser.add_argument("--bench", action="store_true", help="time the replay ticks")
+    args = parser.parse_args()
+
+    if args.command == "info":
+        info(args)
+    else:
+        session(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# File: render.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Script to render the pyqtplotNN.png images headless and in parallel """
+
+import argparse
+import importlib
+import multiprocessing
+import os
+import pathlib
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = pathlib.Path(__file__).resolve().parent
+SCRIPTS = sorted(path.stem for path in ROOT.glob("pyqtplot[0-9][0-9].py"))
+
+
+def init_worker():
+    """Create the one QApplication of a worker process on the offscreen platform."""
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    sys.path.insert(0, str(ROOT))
+
+    from PyQt6 import QtWidgets
+
+    # keep a reference, the application lives as long as the worker
+    init_worker.app = QtWidgets.QApplication([])
+
+
+def render(name, outdir, ticks=0):
+    """Build the MainWindow of the script, advance its animation and save it."""
+    from PyQt6 import QtWidgets
+
+    start = time.perf_counter()
+    window = importlib.import_module(name).create_window()
+
+    # animations are advanced by hand, the timer must not add ticks of its own
+    timer = getattr(window, "timer", None)
+    if timer is not None:
+        timer.stop()
+        for _ in range(ticks):
+            window.update_data_line()
+
+    window.show()
+    QtWidgets.QApplication.processEvents()
+    path = pathlib.Path(outdir) / f"{name}.png"
+    if not window.grab().save(str(path)):
+        raise OSError(f"could not save {path}")
+    window.close()
+    return path, time.perf_counter() - start
+
+
+def main():
+    """Render the selected scripts over a process pool."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("scripts", nargs="*", default=SCRIPTS, help="scripts to render")
+    parser.add_argument("--outdir", default=str(ROOT), help="output directory")
+    parser.add_argument("--ticks", type=int, default=0, help="animation ticks to run")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="processes")
+    args = parser.parse_args()
+
+    names = [pathlib.Path(script).stem for script in args.scripts]
+    pathlib.Path(args.outdir).mkdir(parents=True, exist_ok=True)
+
+    # spawn, a forked Qt application is not safe to use in the children
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=min(args.jobs, len(names)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+    ) as pool:
+        futures = [pool.submit(render, name, args.outdir, args.ticks) for name in names]
+        for future in futures:
+            path, elapsed = future.result()
+            print(f"{path} {elapsed:.2f}s")
+    print(f"rendered {len(names)} images in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
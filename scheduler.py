@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# File: scheduler.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module with a frame scheduler shared by the updating plot windows """
+
+import time
+
+from PyQt6 import QtCore
+
+
+class FrameClient:
+    """Handle of a callback registered with a FrameScheduler.
+
+    It has the start/stop/isActive interface of the QTimer it replaces."""
+
+    def __init__(self, scheduler, callback):
+        self.scheduler = scheduler
+        self.callback = callback
+        self.pending = 0  # frames due since the last call
+        self.dropped = 0  # frames merged into a later call
+
+    def start(self):
+        """Start calling back on every frame."""
+        self.scheduler.attach(self)
+
+    def stop(self):
+        """Stop calling back, frames due meanwhile are discarded."""
+        self.scheduler.detach(self)
+        self.pending = 0
+
+    def isActive(self):
+        """Return whether the callback is scheduled."""
+        return self in self.scheduler.clients
+
+
+class FrameScheduler(QtCore.QObject):
+    """One timer driving the updates of every plot window at a frame budget.
+
+    Frames are due on a fixed grid of `budget` milliseconds. When a frame
+    runs late the frames whose deadline already passed are not queued but
+    dropped, and each callback receives the number of frames due since its
+    previous call, so it can merge the pending data into one update. The
+    callbacks of a frame run in round robin order until the budget is
+    spent, the remaining ones are deferred to the next frame with their
+    pending frames, so many live windows degrade gracefully."""
+
+    sigFrameDropped = QtCore.pyqtSignal(int)  # number of frames dropped
+
+    def __init__(self, budget=50, parent=None):
+        super().__init__(parent)
+        self.budget = budget / 1000
+        self.clients = []
+        self.frames = 0  # frames run
+        self.dropped = 0  # frames dropped
+        self._deadline = None
+        self._next = 0  # client to run first in the next frame
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.frame)
+
+    def add(self, callback):
+        """Register a callback taking the number of frames due and start it."""
+        client = FrameClient(self, callback)
+        client.start()
+        return client
+
+    def attach(self, client):
+        """Schedule the client from the next frame on."""
+        if client in self.clients:
+            return
+        self.clients.append(client)
+        if not self.timer.isActive():
+            self._deadline = time.perf_counter() + self.budget
+            self.timer.start(int(1000 * self.budget))
+
+    def detach(self, client):
+        """Stop scheduling the client, and the timer with the last one."""
+        if client in self.clients:
+            self.clients.remove(client)
+        if not self.clients:
+            self.timer.stop()
+
+    def frame(self):
+        """Run the due callbacks and arm the timer for the next frame."""
+        start = time.perf_counter()
+        missed = max(0, int((start - self._deadline) // self.budget))
+        self._deadline += (missed + 1) * self.budget
+        self.frames += 1
+        if missed:
+            self.dropped += missed
+            self.sigFrameDropped.emit(missed)
+
+        clients = self.clients[self._next :] + self.clients[: self._next]
+        for client in clients:
+            client.pending += missed + 1
+
+        ran = 0
+        for client in clients:
+            # at least one callback runs, so every client makes progress
+            if ran and time.perf_counter() - start > self.budget:
+                break
+            frames, client.pending = client.pending, 0
+            client.dropped += frames - 1
+            client.callback(frames)
+            ran += 1
+        self._next = (self._next + ran) % len(self.clients) if self.clients else 0
+
+        if self.clients:
+            wait = self._deadline - time.perf_counter()
+            self.timer.start(max(0, int(1000 * wait)))
+
+    def stats(self):
+        """Return the frames run and dropped, in total and per callback."""
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "clients": [
+                {"callback": repr(client.callback), "dropped": client.dropped}
+                for client in self.clients
+            ],
+        }
+
+
+_shared = None
+
+
+def shared_scheduler():
+    """Return the FrameScheduler shared by every window of the process."""
+    global _shared
+    if _shared is None:
+        _shared = FrameScheduler()
+    return _shared
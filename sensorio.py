@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# File: sensorio.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Script to ingest framed sensor readings from local sockets with asyncio """
+
+import argparse
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+from datasource import SPSCBuffer
+
+# one reading on the wire: sensor id, time in hours, temperature in degree C
+RECORD = np.dtype([("sensor", "<u4"), ("time", "<f8"), ("value", "<f8")])
+
+# readings per UDP datagram, keeps the datagram under 64 KiB
+DATAGRAM = 65000 // RECORD.itemsize
+
+
+def demultiplex(records):
+    """Split a record array by sensor id, keeping the order of each sensor."""
+    order = np.argsort(records["sensor"], kind="stable")
+    records = records[order]
+    starts = np.flatnonzero(np.diff(records["sensor"])) + 1
+    return {
+        int(group["sensor"][0]): group
+        for group in np.split(records, starts)
+        if len(group)
+    }
+
+
+class SensorIngest:
+    """Asyncio server ingesting readings from TCP clients or UDP datagrams.
+
+    The asyncio loop runs in a worker thread. Readings are parsed with
+    np.frombuffer, demultiplexed by sensor id and written to one SPSCBuffer
+    per sensor, which the Qt side drains once per frame with drain(), so
+    the two event loops only share lock-free buffers."""
+
+    def __init__(self, host="127.0.0.1", port=9000, udp=False, capacity=1 << 16):
+        self.host = host
+        self.port = port
+        self.udp = udp
+        self.capacity = capacity
+        self.buffers = {}
+        self.received = 0
+        self._loop = None
+        self._stopped = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None  # exception that stopped the worker thread
+
+    def dispatch(self, data):
+        """Append the complete records of data to the buffers of their sensors."""
+        records = np.frombuffer(data, dtype=RECORD)
+        self.received += len(records)
+        for sensor, group in demultiplex(records).items():
+            buffer = self.buffers.get(sensor)
+            if buffer is None:
+                buffer = self.buffers[sensor] = SPSCBuffer(self.capacity, RECORD)
+            buffer.write(group)
+
+    def drain(self):
+        """Return the readings received since the last call, by sensor id."""
+        # the ingest thread may add sensors meanwhile, iterate over a snapshot
+        return {
+            sensor: buffer.read()
+            for sensor, buffer in list(self.buffers.items())
+            if len(buffer)
+        }
+
+    async def _client(self, reader, writer):
+        """Read a TCP stream of records, a record may span two reads."""
+        pending = b""
+        while data := await reader.read(1 << 16):
+            data = pending + data
+            cut = len(data) - len(data) % RECORD.itemsize
+            self.dispatch(data[:cut])
+            pending = data[cut:]
+        writer.close()
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        if self.udp:
+            ingest = self
+
+            class Protocol(asyncio.DatagramProtocol):
+                def datagram_received(self, data, addr):
+                    ingest.dispatch(data[: len(data) - len(data) % RECORD.itemsize])
+
+            transport, _ = await self._loop.create_datagram_endpoint(
+                Protocol, local_addr=(self.host, self.port)
+            )
+            self._ready.set()
+            await self._stopped.wait()
+            transport.close()
+        else:
+            server = await asyncio.start_server(self._client, self.host, self.port)
+            self._ready.set()
+            async with server:
+                await self._stopped.wait()
+
+    def _run(self):
+        """Run the asyncio loop, keeping the exception that stops it."""
+        try:
+            asyncio.run(self._serve())
+        except Exception as error:
+            self._error = error
+        finally:
+            # start() returns even when the server never listened
+            self._ready.set()
+
+    def start(self):
+        """Start the asyncio loop in a worker thread and wait until it listens.
+
+        Raises the exception of the worker thread if the server could not
+        listen, e.g. OSError when the port is already in use."""
+        self._ready.clear()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._error
+
+    def stop(self):
+        """Stop the server and its thread."""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._stopped.set)
+        self._thread.join()
+        self._thread = None
+
+
+async def emit(host, port, sensors, rate, duration, udp=False):
+    """Fake sensors sending random walk temperatures at rate readings/s each."""
+    loop = asyncio.get_running_loop()
+    if udp:
+        transport, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=(host, port)
+        )
+        send = transport.sendto
+    else:
+        _, writer = await asyncio.open_connection(host, port)
+        send = writer.write
+
+    rng = np.random.default_rng()
+    value = 30 + rng.standard_normal(sensors)
+    origin = time.perf_counter()
+    sent = 0
+    while (elapsed := time.perf_counter() - origin) < duration:
+        due = int(elapsed * rate) - sent // sensors
+        if due > 0:
+            records = np.empty((due, sensors), dtype=RECORD)
+            records["sensor"] = np.arange(sensors)
+            index = sent // sensors + np.arange(1, due + 1)
+            noise = 0.1 * rng.standard_normal((due, sensors))
+            records["time"] = (index / rate / 3600)[:, np.newaxis]
+            records["value"] = value + np.cumsum(noise, axis=0)
+            value = records["value"][-1]
+            records = records.ravel()
+            chunk = DATAGRAM if udp else len(records)
+            for start in range(0, len(records), chunk):
+                send(records[start : start + chunk].tobytes())
+            sent += len(records)
+            if not udp:
+                await writer.drain()
+        await asyncio.sleep(0.01)
+
+    if udp:
+        transport.close()
+    else:
+        writer.close()
+        await writer.wait_closed()
+    return sent
+
+
+def bench(args):
+    """Measure the ingest throughput of fake sensors on a local socket."""
+    ingest = SensorIngest(args.host, args.port, args.udp)
+    ingest.start()
+
+    drained = 0
+
+    async def run():
+        nonlocal drained
+        task = asyncio.create_task(
+            emit(args.host, args.port, args.sensors, args.rate, args.duration, args.udp)
+        )
+        while not task.done():
+            await asyncio.sleep(0.05)  # the frame period of the plots
+            drained += sum(len(group) for group in ingest.drain().values())
+        await asyncio.sleep(0.2)
+        drained += sum(len(group) for group in ingest.drain().values())
+        return task.result()
+
+    start = time.perf_counter()
+    sent = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    ingest.stop()
+    print(
+        f"{args.sensors} sensors: sent {sent} drained {drained} readings "
+        f"in {elapsed:.2f}s, {drained / elapsed:.0f} readings/s"
+    )
+
+
+def plot(args):
+    """Plot the live readings of the sensors in the pyqtplot10 window."""
+    import sys
+
+    from PyQt6 import QtWidgets
+
+    import pyqtplot10
+    from scheduler import shared_scheduler
+
+    app = QtWidgets.QApplication(sys.argv)
+    window = pyqtplot10.MainWindow()
+    window.graphWidget.enableAutoRange()
+    colors = ["#d81b60", "#1e88e5", "#43a047", "#fdd835", "#8e24aa", "#00acc1"]
+    curves = {
+        sensor: window.graphPlot(
+            [], [], f"Sensor {sensor + 1}", colors[sensor % 6], colors[sensor % 6]
+        )
+        for sensor in range(args.sensors)
+    }
+
+    ingest = SensorIngest(args.host, args.port, args.udp)
+    ingest.start()
+
+    def update_data_line(frames=1):
+        for sensor, group in ingest.drain().items():
+            if sensor in curves:
+                curves[sensor].extend(group["time"], group["value"])
+
+    window.timer = shared_scheduler().add(update_data_line)
+
+    if args.emit:
+        threading.Thread(
+            target=asyncio.run,
+            args=(
+                emit(
+                    args.host,
+                    args.port,
+                    args.sensors,
+                    args.rate,
+                    args.duration,
+                    args.udp,
+                ),
+            ),
+            daemon=True,
+        ).start()
+
+    window.show()
+    status = app.exec()
+    ingest.stop()
+    sys.exit(status)
+
+
+def main():
+    """Run the ingest benchmark, the fake sensors or the live plot."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=("bench", "emit", "plot"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--udp", action="store_true", help="UDP instead of TCP")
+    parser.add_argument("--sensors", type=int, default=2)
+    parser.add_argument("--rate", type=float, default=10, help="readings/s per sensor")
+    parser.add_argument("--duration", type=float, default=5, help="seconds to emit")
+    parser.add_argument("--emit", action="store_true", help="plot with fake sensors")
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        bench(args)
+    elif args.command == "emit":
+        sent = asyncio.run(
+            emit(args.host, args.port, args.sensors, args.rate, args.duration, args.udp)
+        )
+        print(f"sent {sent} readings")
+    else:
+        plot(args)
+
+
+if __name__ == "__main__":
+    main()
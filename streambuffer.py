@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+# File: streambuffer.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module with NumPy-backed buffers for the scrolling plot windows """
+
+from collections import deque
+
+import numpy as np
+
+from precision import float_dtype
+
+
+def _origin(values, rebase):
+    """Return the origin of an empty buffer whose first values are given."""
+    values = np.ravel(values)
+    if rebase is None or not values.size or abs(values[0]) <= rebase:
+        return 0.0
+    return float(values[0])
+
+
+def _relative(values, dtype, origin):
+    """Return values as a flat array of dtype, relative to the origin."""
+    if origin:
+        values = np.asarray(values, dtype=np.float64) - origin
+    return np.asarray(values, dtype=dtype).ravel()
+
+
+class SlidingExtrema:
+    """Minimum and maximum of the last `window` samples of a stream.
+
+    Two monotonic deques of (index, value) pairs hold the candidates for
+    the minimum and the maximum, so each pushed sample costs amortized O(1)
+    and the extrema are read in O(1). With window=None the extrema of every
+    sample pushed so far are kept."""
+
+    def __init__(self, window=None):
+        self.window = window
+        self._count = 0  # number of samples pushed so far
+        self._min = deque()
+        self._max = deque()
+
+    def push(self, value):
+        """Add one sample and evict the candidates that left the window."""
+        index = self._count
+        self._count += 1
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((index, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((index, value))
+        if self.window is not None:
+            oldest = self._count - self.window
+            if self._min[0][0] < oldest:
+                self._min.popleft()
+            if self._max[0][0] < oldest:
+                self._max.popleft()
+
+    def extend(self, values):
+        """Add a batch of samples, only the last `window` can be extrema."""
+        values = np.asarray(values).ravel()
+        if self.window is not None and values.size > self.window:
+            self._count += values.size - self.window
+            self._min.clear()
+            self._max.clear()
+            values = values[-self.window :]
+        for value in values.tolist():
+            self.push(value)
+
+    def min(self):
+        """Return the minimum of the window."""
+        if not self._min:
+            raise ValueError("min of empty window")
+        return self._min[0][1]
+
+    def max(self):
+        """Return the maximum of the window."""
+        if not self._max:
+            raise ValueError("max of empty window")
+        return self._max[0][1]
+
+    def clear(self):
+        """Forget every sample."""
+        self._count = 0
+        self._min.clear()
+        self._max.clear()
+
+
+class RingBuffer:
+    """Fixed capacity circular buffer with O(1) push and a contiguous view.
+
+    The storage is twice the capacity and every sample is written at both
+    index i and i + capacity, so the last `capacity` samples are always one
+    contiguous slice of the storage and no copy is needed to plot them.
+
+    The dtype defaults to that of the precision policy. With rebase, the
+    samples are stored relative to `origin`, which moves to the oldest
+    sample whenever that one exceeds rebase in magnitude, so a growing x
+    keeps its resolution in float32. view(), min() and max() are relative
+    to the origin, push(), extend(), last() take and return absolute values."""
+
+    def __init__(self, capacity, dtype=None, extrema=False, rebase=None):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity = int(capacity)
+        self._data = np.zeros(2 * self.capacity, dtype=float_dtype(dtype))
+        self._head = 0  # index of the oldest sample
+        self._size = 0
+        self.extrema = SlidingExtrema(self.capacity) if extrema else None
+        self.rebase = rebase
+        self.origin = 0.0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def dtype(self):
+        """Data type of the stored samples."""
+        return self._data.dtype
+
+    def push(self, value):
+        """Append one sample, dropping the oldest one if the buffer is full."""
+        if not self._size:
+            self.origin = _origin(value, self.rebase)
+        value = value - self.origin if self.origin else value
+        tail = (self._head + self._size) % self.capacity
+        self._data[tail] = value
+        self._data[tail + self.capacity] = value
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._head = (self._head + 1) % self.capacity
+        if self.extrema is not None:
+            self.extrema.push(value)
+        self._rebase()
+
+    def extend(self, values):
+        """Append a batch of samples with vectorised writes."""
+        if not self._size:
+            self.origin = _origin(values, self.rebase)
+        values = _relative(values, self._data.dtype, self.origin)
+        count = values.size
+        if count == 0:
+            return
+        if self.extrema is not None:
+            self.extrema.extend(values)
+        if count >= self.capacity:
+            # only the newest samples survive, the buffer restarts at index 0
+            values = values[-self.capacity :]
+            self._data[: self.capacity] = values
+            self._data[self.capacity :] = values
+            self._head, self._size = 0, self.capacity
+            self._rebase()
+            return
+
+        tail = (self._head + self._size) % self.capacity
+        first = min(count, self.capacity - tail)
+        self._data[tail : tail + first] = values[:first]
+        self._data[tail + self.capacity : tail + self.capacity + first] = values[:first]
+        if first < count:
+            rest = count - first
+            self._data[:rest] = values[first:]
+            self._data[self.capacity : self.capacity + rest] = values[first:]
+
+        overflow = max(0, self._size + count - self.capacity)
+        self._size = min(self.capacity, self._size + count)
+        self._head = (self._head + overflow) % self.capacity
+        self._rebase()
+
+    def _rebase(self):
+        """Move the origin to the oldest sample once it exceeds the limit."""
+        if self.rebase is None or abs(self._data[self._head]) <= self.rebase:
+            return
+        shift = float(self._data[self._head])
+        self._data -= shift  # both copies of every sample
+        self.origin += shift
+        if self.extrema is not None:
+            self.extrema.clear()
+            self.extrema.extend(self.view())
+
+    def view(self):
+        """Return the samples oldest first as a read-only contiguous view.
+
+        The view shares memory with the buffer, it is valid until the next
+        push/extend and can be passed straight to setData."""
+        view = self._data[self._head : self._head + self._size]
+        view.flags.writeable = False
+        return view
+
+    def last(self):
+        """Return the most recently pushed sample."""
+        if not self._size:
+            raise IndexError("last from empty buffer")
+        return float(self._data[self._head + self._size - 1]) + self.origin
+
+    def clear(self):
+        """Remove all samples without releasing the storage."""
+        self._head = 0
+        self._size = 0
+        if self.extrema is not None:
+            self.extrema.clear()
+
+    def min(self):
+        """Return the minimum of the window, O(1) when extrema are tracked."""
+        if self.extrema is not None:
+            return self.extrema.min()
+        return self.view().min()
+
+    def max(self):
+        """Return the maximum of the window, O(1) when extrema are tracked."""
+        if self.extrema is not None:
+            return self.extrema.max()
+        return self.view().max()
+
+
+class SlidingSeries:
+    """Sliding window series with an amortized O(1) append.
+
+    Samples are appended to the end of an oversized backing array and the
+    window is the slice [start:end] of it. When the end of the array is
+    reached the window is compacted to the front, so the copy is paid once
+    every `capacity - window` appends. With window=None the series keeps
+    every sample and the backing array doubles whenever it is full.
+
+    The dtype and rebase work as in RingBuffer: view(), min() and max() are
+    relative to `origin`, the other methods take and return absolute values."""
+
+    def __init__(
+        self, window=None, dtype=None, capacity=None, extrema=False, rebase=None
+    ):
+        if window is not None and window < 1:
+            raise ValueError("window must be a positive integer or None")
+        self.window = window
+        if capacity is None:
+            capacity = 2 * window if window is not None else 1024
+        if window is not None and capacity < window + 1:
+            raise ValueError("capacity must be larger than the window")
+        self._data = np.empty(int(capacity), dtype=float_dtype(dtype))
+        self._start = 0
+        self._end = 0
+        self.extrema = SlidingExtrema(window) if extrema else None
+        self.rebase = rebase
+        self.origin = 0.0
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def dtype(self):
+        """Data type of the stored samples."""
+        return self._data.dtype
+
+    def _reserve(self, count):
+        """Make room for count more samples at the end of the backing array."""
+        if self._end + count <= self._data.size:
+            return
+        size = len(self)
+        keep = size if self.window is None else min(size, self.window)
+        capacity = self._data.size
+        while keep + count > capacity or (self.window is None and capacity < 2 * keep):
+            capacity *= 2
+        if capacity != self._data.size:
+            data = np.empty(capacity, dtype=self._data.dtype)
+        else:
+            data = self._data
+        data[:keep] = self._data[self._end - keep : self._end]
+        self._data = data
+        self._start, self._end = 0, keep
+
+    def append(self, value):
+        """Append one sample and slide the window if it is full."""
+        if self._end == self._start:
+            self.origin = _origin(value, self.rebase)
+        value = value - self.origin if self.origin else value
+        if self._end == self._data.size:
+            self._reserve(1)
+        self._data[self._end] = value
+        self._end += 1
+        if self.window is not None and self._end - self._start > self.window:
+            self._start += 1
+        if self.extrema is not None:
+            self.extrema.push(value)
+        self._rebase()
+
+    def extend(self, values):
+        """Append a batch of samples and slide the window past the oldest."""
+        if self._end == self._start:
+            self.origin = _origin(values, self.rebase)
+        values = _relative(values, self._data.dtype, self.origin)
+        if self.window is not None and values.size > self.window:
+            values = values[-self.window :]
+        count = values.size
+        self._reserve(count)
+        self._data[self._end : self._end + count] = values
+        self._end += count
+        if self.window is not None:
+            self._start = max(self._start, self._end - self.window)
+        if self.extrema is not None:
+            self.extrema.extend(values)
+        self._rebase()
+
+    def _rebase(self):
+        """Move the origin to the oldest sample once it exceeds the limit."""
+        if self.rebase is None or self._end == self._start:
+            return
+        if abs(self._data[self._start]) <= self.rebase:
+            return
+        shift = float(self._data[self._start])
+        self._data[self._start : self._end] -= shift
+        self.origin += shift
+        if self.extrema is not None:
+            self.extrema.clear()
+            self.extrema.extend(self.view())
+
+    def view(self):
+        """Return the window oldest first as a read-only contiguous view.
+
+        The view shares memory with the backing array, it is valid until
+        the next append/extend and can be passed straight to setData."""
+        view = self._data[self._start : self._end]
+        view.flags.writeable = False
+        return view
+
+    def first(self):
+        """Return the oldest sample in the window."""
+        if self._end == self._start:
+            raise IndexError("first from empty series")
+        return float(self._data[self._start]) + self.origin
+
+    def last(self):
+        """Return the newest sample in the window."""
+        if self._end == self._start:
+            raise IndexError("last from empty series")
+        return float(self._data[self._end - 1]) + self.origin
+
+    def clear(self):
+        """Remove all samples without releasing the backing array."""
+        self._start = 0
+        self._end = 0
+        if self.extrema is not None:
+            self.extrema.clear()
+
+    def min(self):
+        """Return the minimum of the window, O(1) when extrema are tracked."""
+        if self.extrema is not None:
+            return self.extrema.min()
+        return self.view().min()
+
+    def max(self):
+        """Return the maximum of the window, O(1) when extrema are tracked."""
+        if self.extrema is not None:
+            return self.extrema.max()
+        return self.view().max()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+# File: sweep.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Script to sweep the Lorenz parameters over a process pool and plot them """
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from lorenz import BETA, integrate
+from precision import DTYPES, float_dtype
+
+
+def _integrate_block(
+    name, shape, dtype, start, stop, sigma, rho, beta, state0, delt, method
+):
+    """Integrate the members [start, stop) into the shared trajectories."""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        out = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        state = np.tile(state0, (stop - start, 1))
+        integrate(
+            state,
+            shape[0],
+            delt,
+            method,
+            out[:, start:stop],
+            sigma=sigma,
+            rho=rho,
+            beta=beta,
+        )
+    finally:
+        block.close()
+
+
+def sweep(
+    sigmas,
+    rhos,
+    nstep,
+    delt=0.01,
+    method="rk4",
+    beta=BETA,
+    state0=(1.0, 1.0, 1.0),
+    workers=None,
+    dtype=None,
+):
+    """Integrate a trajectory for every (rho, sigma) pair of the grid.
+
+    The grid is split into blocks of trajectories integrated by a pool of
+    processes, each writing its block straight into one shared memory
+    array, so only the parameters of a block are pickled. Returns the
+    trajectories as an array of shape (nstep, len(rhos), len(sigmas), 3)
+    of dtype, that of the precision policy by default."""
+    dtype = float_dtype(dtype)
+    rho, sigma = (
+        grid.ravel().astype(dtype) for grid in np.meshgrid(rhos, sigmas, indexing="ij")
+    )
+    shape = (nstep, len(rho), 3)
+    workers = workers or os.cpu_count()
+
+    # a few blocks per worker balance the load of uneven blocks
+    bounds = np.linspace(0, len(rho), min(4 * workers, len(rho)) + 1).astype(int)
+
+    block = shared_memory.SharedMemory(
+        create=True, size=dtype.itemsize * int(np.prod(shape))
+    )
+    try:
+        with ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _integrate_block,
+                    block.name,
+                    shape,
+                    dtype,
+                    start,
+                    stop,
+                    sigma[start:stop],
+                    rho[start:stop],
+                    beta,
+                    np.asarray(state0, dtype=dtype),
+                    delt,
+                    method,
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+                if stop > start
+            ]
+            for future in futures:
+                future.result()
+        out = np.ndarray(shape, dtype=dtype, buffer=block.buf).copy()
+    finally:
+        block.close()
+        block.unlink()
+    return out.reshape(nstep, len(rhos), len(sigmas), 3)
+
+
+def thumbnails(trajectories, stride=1, margin=0.05):
+    """Return the x-z projections of the trajectories scaled into grid cells.
+
+    The trajectory of row i and column j is scaled to its own bounds and
+    drawn in the unit cell [j, j + 1] x [i, i + 1], in one vectorised pass
+    over the grid. The points are returned flattened with the connect
+    array that breaks the line between the cells."""
+    points = trajectories[::stride, :, :, ::2]  # x and z of every member
+    low = np.nanmin(points, axis=0)
+    span = np.nanmax(points, axis=0) - low
+    span[span == 0] = 1
+    scaled = margin + (1 - 2 * margin) * (points - low) / span
+
+    nrow, ncol = points.shape[1:3]
+    xval = scaled[..., 0] + np.arange(ncol)
+    yval = scaled[..., 1] + np.arange(nrow)[:, np.newaxis]
+
+    # one series per cell, points of a cell are consecutive
+    xval = xval.transpose(1, 2, 0).ravel()
+    yval = yval.transpose(1, 2, 0).ravel()
+    connect = np.ones(len(xval), dtype=bool)
+    connect[len(points) - 1 :: len(points)] = False
+    return xval, yval, connect
+
+
+def bench(args, sigmas, rhos):
+    """Time the sweep with 1 up to the given number of workers."""
+    base = None
+    for workers in sorted({1, *range(2, args.workers + 1, 2), args.workers}):
+        start = time.perf_counter()
+        sweep(
+            sigmas,
+            rhos,
+            args.nstep,
+            args.delt,
+            args.method,
+            workers=workers,
+            dtype=args.dtype,
+        )
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print(f"{workers:>3} workers {elapsed:8.3f}s speedup {base / elapsed:5.2f}x")
+
+
+def plot(args, sigmas, rhos):
+    """Show the grid of thumbnails and the trajectory of the clicked cell."""
+    import pyqtgraph as pg
+    from PyQt6 import QtCore, QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv)
+
+    start = time.perf_counter()
+    trajectories = sweep(
+        sigmas, rhos, args.nstep, args.delt, args.method, dtype=args.dtype
+    )
+    print(f"swept {len(rhos)}x{len(sigmas)} in {time.perf_counter() - start:.2f}s")
+
+    window = QtWidgets.QMainWindow()
+    window.resize(QtCore.QSize(1200, 640))
+    graphWidget = pg.GraphicsLayoutWidget()
+    window.setCentralWidget(graphWidget)
+    graphWidget.setBackground("#121317")
+
+    # widget for generating multi-panel figures
+    graphGrid = graphWidget.addPlot(row=0, col=0)
+    graphLine = graphWidget.addPlot(row=0, col=1)
+    graphWidget.ci.layout.setColumnStretchFactor(0, 2)
+
+    # every thumbnail a cell of one item, one vertex array for the grid
+    stride = max(1, args.nstep // 400)
+    xval, yval, connect = thumbnails(trajectories, stride)
+    graphGrid.plot(xval, yval, connect=connect, pen=pg.mkPen(color="#dcdcdc"))
+    graphGrid.setRange(xRange=(0, len(sigmas)), yRange=(0, len(rhos)), padding=0)
+
+    # label the cells with their parameters, about eight labels per axis
+    styles = {"color": "#dcdcdc", "font-size": "10pt"}
+    graphGrid.setLabel("bottom", "sigma", **styles)
+    graphGrid.setLabel("left", "rho", **styles)
+    for name, values in (("bottom", sigmas), ("left", rhos)):
+        every = max(1, len(values) // 8)
+        ticks = [(i + 0.5, f"{value:.3g}") for i, value in enumerate(values)]
+        graphGrid.getAxis(name).setTicks([ticks[::every]])
+
+    graphLine.hideAxis("left")
+    graphLine.hideAxis("bottom")
+    detail = graphLine.plot(pen=pg.mkPen(color="#dcdcdc"))
+
+    def show_cell(row, col):
+        """Draw the trajectory of one cell in the detail panel."""
+        detail.setData(trajectories[:, row, col, 0], trajectories[:, row, col, 2])
+        graphLine.setTitle(
+            f"sigma {sigmas[col]:.3g}, rho {rhos[row]:.3g}", color="#dcdcdc"
+        )
+
+    def clicked(event):
+        point = graphGrid.vb.mapSceneToView(event.scenePos())
+        col, row = int(np.floor(point.x())), int(np.floor(point.y()))
+        if 0 <= row < len(rhos) and 0 <= col < len(sigmas):
+            show_cell(row, col)
+
+    graphWidget.scene().sigMouseClicked.connect(clicked)
+    show_cell(len(rhos) // 2, len(sigmas) // 2)
+
+    window.show()
+    if args.output:
+        app.processEvents()
+        window.grab().save(args.output)
+        return
+    sys.exit(app.exec())
+
+
+def main():
+    """Sweep the Lorenz parameters and plot the grid or time the sweep."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sigma", type=float, nargs=2, default=(5.0, 15.0))
+    parser.add_argument("--rho", type=float, nargs=2, default=(20.0, 40.0))
+    parser.add_argument("--grid", type=int, nargs=2, default=(32, 32), help="rho sigma")
+    parser.add_argument("--nstep", type=int, default=4000)
+    parser.add_argument("--delt", type=float, default=0.01)
+    parser.add_argument("--method", choices=("euler", "rk4"), default="rk4")
+    parser.add_argument("--dtype", choices=DTYPES, help="storage of the trajectories")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--bench", action="store_true", help="time 1 to workers")
+    parser.add_argument("--output", help="save the window to this image and exit")
+    args = parser.parse_args()
+
+    rhos = np.linspace(*args.rho, args.grid[0])
+    sigmas = np.linspace(*args.sigma, args.grid[1])
+    if args.bench:
+        bench(args, sigmas, rhos)
+    else:
+        plot(args, sigmas, rhos)
+
+
+if __name__ == "__main__":
+    main()
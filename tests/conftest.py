@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# File: conftest.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Fixtures shared by the tests of the plot modules """
+
+import os
+import sys
+
+import pytest
+
+# the modules live next to the scripts, the windows are never shown on screen
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Return the QApplication of the test session."""
+    from PyQt6 import QtWidgets
+
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# File: test_datasource.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Tests of the data sources of the updating plots """
+
+import argparse
+
+import numpy as np
+
+import datasource
+
+
+def test_plot_autoranges_y(qapp, tmp_path):
+    """The y range follows the mapped data, not the sensor range of pyqtplot10."""
+    path = tmp_path / "rows.bin"
+    xval = np.arange(5000, dtype=np.float32) / 1000
+    np.stack((xval, np.sin(xval)), axis=1).tofile(path)
+    args = argparse.Namespace(file=str(path), columns=2, dtype="float32", window=2000)
+
+    window = datasource.create_window(args)
+    window.timer.stop()
+    window.show()
+    qapp.processEvents()
+
+    (xmin, xmax), (ymin, ymax) = window.graphWidget.viewRange()
+    assert (xmin, xmax) == (float(xval[3000]), float(xval[-1]))
+    # the sine over the last 2000 rows, from sin(3) down to -1
+    assert -1.1 < ymin < -1 and 0.14 < ymax < 0.25
+    window.close()
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# File: test_decimate.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Tests of the decimated curves of the large series """
+
+import numpy as np
+import pyqtgraph as pg
+
+from decimate import DecimatedCurve
+
+
+def test_extend_promotes_int_series(qapp):
+    """Float points appended to an int series keep their fraction."""
+    plot = pg.PlotItem()
+    curve = DecimatedCurve(plot, list(range(11)), [22, 23] * 5 + [22], pyramid=True)
+    curve.extend([10.25, 10.5, 10.75], [22.5, 23.5, 24.5])
+
+    assert curve.xval.dtype.kind == "f"
+    np.testing.assert_array_equal(curve.xval[-4:], [10, 10.25, 10.5, 10.75])
+    np.testing.assert_array_equal(curve.yval[-3:], [22.5, 23.5, 24.5])
+    assert np.all(np.diff(curve.xval) > 0)
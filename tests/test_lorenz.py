@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# File: test_lorenz.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Tests of the Lorenz integrator and its lazy stream """
+
+import numpy as np
+import pytest
+
+import precision
+from lorenz import LorenzStream
+
+
+@pytest.mark.parametrize("count", [10, 1000])
+def test_take_keeps_stream_dtype(count):
+    """Points taken past the chunk keep the dtype of the stream, not the policy."""
+    policy = precision.float_dtype()
+    precision.set_float_dtype("float32")
+    try:
+        stream = LorenzStream(np.ones(3), 10, chunk=256, dtype="float64")
+        assert all(values.dtype == np.float64 for values in stream.take(count))
+    finally:
+        precision.set_float_dtype(policy)
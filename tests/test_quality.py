@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# File: test_quality.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Tests of the quality levels of the animated plots """
+
+import numpy as np
+import pyqtgraph as pg
+
+from progressive import ProgressiveCurve
+from quality import QualityController
+
+
+def test_styled_items_follow_the_view(qapp):
+    """Items merged away by a ProgressiveCurve are not kept by the controller."""
+    view = pg.PlotWidget()
+    curve = ProgressiveCurve(view, chunk=16)
+    quality = QualityController(view, thresholds=(100,))
+    xval = np.arange(2000.0)
+    for count in range(1, len(xval), 37):
+        curve.setData(xval[:count], np.sin(xval[:count]))
+        quality.update(count)
+
+    assert quality.level == 1
+    assert set(quality._styled) == set(view.listDataItems())
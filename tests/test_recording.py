@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# File: test_recording.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Tests of the session recordings and their replay """
+
+import numpy as np
+import pytest
+
+from recording import Recorder, Recording, ReplaySource
+
+
+def test_recorder_flushes_after_interval(tmp_path):
+    """Rows older than the interval are on disk before the chunk is full."""
+    path = tmp_path / "session.rec"
+    recorder = Recorder(path, ("x", "y"), interval=0.0)
+    recorder.write([0.0, 1.0], [5.0, 6.0])
+    recorder.write([2.0], [7.0])
+
+    recording = Recording(path)
+    assert len(recording) == 3
+    np.testing.assert_array_equal(recording.read(0, 3)["y"], [5.0, 6.0, 7.0])
+    recorder.close()
+
+
+@pytest.mark.parametrize("seek", [0.0, -1.0])
+def test_history_is_seeded_with_the_first_tick(tmp_path, seek):
+    """A window replaying from before the first row gets a sample to start from."""
+    path = tmp_path / "session.rec"
+    with Recorder(path, ("x", "y")) as recorder:
+        recorder.write([0.0, 1.0], [5.0, 6.0])
+        recorder.write([2.0], [7.0])
+
+    source = ReplaySource(path, speed=0, seek=seek)
+    history = source.history(100)
+    np.testing.assert_array_equal(history["y"], [5.0, 6.0])
+    np.testing.assert_array_equal(source.read()["y"], [7.0])
+
+
+def test_history_of_an_empty_recording(tmp_path):
+    """An empty recording cannot seed a window."""
+    path = tmp_path / "session.rec"
+    Recorder(path, ("x", "y")).close()
+
+    with pytest.raises(ValueError, match="no rows"):
+        ReplaySource(path).history(100)
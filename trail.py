@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# File: trail.py
+# Name: D.Saravanan
+# Date: 17/10/2026
+
+""" Module with a bounded trail curve for the indefinitely animated plots """
+
+import numpy as np
+import pyqtgraph as pg
+
+from streambuffer import RingBuffer
+
+
+class TrailCurve:
+    """Curve drawing only the last `length` points appended to it.
+
+    The points are kept in RingBuffers, whose contiguous views are handed
+    to setData, so a frame costs O(length) however long the animation
+    runs. With fade the trail is drawn as `bands` items of equal length,
+    the oldest the most transparent. The alpha of every band is computed
+    in one vectorised pass when the curve is built, a band always covers
+    the same ages, so its pen never changes and a frame only moves the
+    slices of the view handed to the bands."""
+
+    def __init__(self, plot, length, fade=False, bands=8, **kwargs):
+        self.length = length
+        self.xval = RingBuffer(length)
+        self.yval = RingBuffer(length)
+
+        pen = pg.mkPen(kwargs.pop("pen", None))
+        if not fade:
+            bands = 1
+        # alpha of every band, from the oldest to the newest
+        alpha = np.linspace(1 / bands, 1, bands) ** 2 * pen.color().alpha()
+        self.bands = []
+        for value in alpha.astype(int):
+            color = pen.color()
+            color.setAlpha(int(value))
+            faded = pg.mkPen(pen)
+            faded.setColor(color)
+            self.bands.append(plot.plot(pen=faded, **kwargs))
+
+    def __len__(self):
+        return len(self.xval)
+
+    def extend(self, xval, yval):
+        """Append points, the oldest ones beyond length are dropped."""
+        self.xval.extend(xval)
+        self.yval.extend(yval)
+        xval, yval = self.xval.view(), self.yval.view()
+
+        # consecutive bands share their end point to keep the line connected
+        bounds = np.linspace(0, len(xval), len(self.bands) + 1).astype(int)
+        for band, start, end in zip(self.bands, bounds[:-1], bounds[1:]):
+            end = min(end + 1, len(xval))
+            band.setData(xval[start:end], yval[start:end])
+
+    def clear(self):
+        """Remove every point."""
+        self.xval.clear()
+        self.yval.clear()
+        for band in self.bands:
+            band.setData([], [])